@@ -20,6 +20,9 @@ from .commands.base_command import BaseCommand
 from .utils import check_internet_connectivity_async, decode_escape_sequences, format_keyword_response_with_placeholders
 from .config_validation import strip_optional_quotes
 
+# Same pattern BaseCommand._strip_mentions removes before keyword matching
+_MENTION_PATTERN = re.compile(r'@\[([^\]]+)\]')
+
 
 @dataclass
 class InternetStatusCache:
@@ -97,6 +100,12 @@ class CommandManager:
         self.plugin_loader = PluginLoader(bot, local_commands_dir=local_commands_dir)
         self.commands = self.plugin_loader.load_all_plugins()
         
+        # First-word index over commands that use BaseCommand's default matching,
+        # built lazily and dropped via invalidate_keyword_index() when keywords change
+        self._keyword_index: Optional[Dict[str, frozenset]] = None
+        self._keyword_index_source: Optional[Dict[str, BaseCommand]] = None
+        self._keyword_indexed_commands: frozenset = frozenset()
+        
         # Cache for internet connectivity status to avoid checking on every command
         # Thread-safe cache with asyncio.Lock
         self._internet_cache = InternetStatusCache(has_internet=True, timestamp=0)
@@ -138,9 +147,9 @@ class CommandManager:
         
         # Don't queue if this user just executed the command
         # Check if user has a recent per-user cooldown entry
-        if message.sender_id in command._user_cooldowns:
-            user_last_exec = command._user_cooldowns[message.sender_id]
-            time_since_user_exec = time.time() - user_last_exec
+        user_last_exec = command._user_cooldowns.get(message.sender_id)
+        if user_last_exec is not None:
+            time_since_user_exec = time.monotonic() - user_last_exec
             
             # If user executed within last 3 seconds, they likely just triggered the global cooldown
             # Don't queue in this case
@@ -1318,6 +1327,74 @@ class CommandManager:
             rate_limit_key=rate_limit_key,
         )
     
+    @staticmethod
+    def _uses_default_matching(command: Any) -> bool:
+        """Check whether a command relies on BaseCommand's keyword-only matching.
+        
+        Args:
+            command: The command instance to inspect.
+            
+        Returns:
+            bool: True if matches_keyword, matches_custom_syntax and should_execute
+                are all inherited unchanged from BaseCommand.
+        """
+        if not isinstance(command, BaseCommand):
+            return False
+        cls = type(command)
+        instance_attrs = vars(command)
+        for name in ('matches_keyword', 'matches_custom_syntax', 'should_execute'):
+            if name in instance_attrs or getattr(cls, name) is not getattr(BaseCommand, name):
+                return False
+        return True
+    
+    def _build_keyword_index(self) -> None:
+        """Index default-matching commands by the first word of each keyword.
+        
+        Commands that override any matching hook, or whose prefix handling differs
+        from the manager's, are left out and always checked via should_execute().
+        """
+        index: Dict[str, set] = {}
+        indexed = set()
+        for command_name, command in self.commands.items():
+            if not self._uses_default_matching(command):
+                continue
+            if getattr(command, '_command_prefix', self.command_prefix) != self.command_prefix:
+                continue
+            first_words = set()
+            for keyword in command.keywords or ():
+                first_word = keyword.lower().split(' ', 1)[0]
+                if not first_word:
+                    break
+                first_words.add(first_word)
+            else:
+                for first_word in first_words:
+                    index.setdefault(first_word, set()).add(command_name)
+                indexed.add(command_name)
+        self._keyword_index = {word: frozenset(names) for word, names in index.items()}
+        self._keyword_indexed_commands = frozenset(indexed)
+        self._keyword_index_source = self.commands
+    
+    def invalidate_keyword_index(self) -> None:
+        """Drop the keyword index so it is rebuilt from current command keywords."""
+        self._keyword_index = None
+    
+    def _get_keyword_candidates(self, content: str) -> Tuple[frozenset, frozenset]:
+        """Look up which indexed commands could match the given content.
+        
+        Args:
+            content: Message content with any command prefix already removed.
+            
+        Returns:
+            Tuple[frozenset, frozenset]: (candidate command names, all indexed names).
+                Commands outside the indexed set must still be checked individually.
+        """
+        if self._keyword_index is None or self._keyword_index_source is not self.commands:
+            self._build_keyword_index()
+        words = _MENTION_PATTERN.sub('', content).lower().split(None, 1)
+        if not words:
+            return frozenset(), self._keyword_indexed_commands
+        return self._keyword_index.get(words[0], frozenset()), self._keyword_indexed_commands
+    
     async def execute_commands(self, message):
         """Execute command objects that handle their own responses.
         
@@ -1343,8 +1420,14 @@ class CommandManager:
         
         content_lower = content.lower()
         
+        # Keyword-only commands whose first word can't match are skipped without
+        # running their matchers; everything else still goes through should_execute()
+        candidates, indexed = self._get_keyword_candidates(content)
+        
         # Check each command to see if it should execute
         for command_name, command in self.commands.items():
+            if command_name in indexed and command_name not in candidates:
+                continue
             if command.should_execute(message):
                 # Only execute commands that don't have a response format (they handle their own responses)
                 response_format = command.get_response_format()
@@ -7,12 +7,17 @@ Provides common functionality and interface for command implementations
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
+from itertools import islice
 import pytz
 import re
+import time
 from ..models import MeshMessage
 from ..security_utils import validate_pubkey_format
 from ..utils import format_elapsed_display, get_config_timezone
 
+# Cooldowns use a monotonic clock so wall-clock adjustments can't extend or skip them
+_monotonic = time.monotonic
+
 
 class BaseCommand(ABC):
     """Base class for all bot commands - Plugin Interface.
@@ -31,6 +36,9 @@ class BaseCommand(ABC):
     cooldown_seconds: int = 0
     category: str = "general"
     
+    # Per-user cooldown entries kept before stale ones are evicted
+    _USER_COOLDOWN_MAX_ENTRIES: int = 1024
+    
     # Documentation fields - to be overridden by subclasses for website generation
     short_description: str = ""  # Brief description for website (without usage syntax)
     usage: str = ""  # Usage syntax, e.g., "wx <zipcode|city> [tomorrow|7d|hourly|alerts]"
@@ -40,7 +48,7 @@ class BaseCommand(ABC):
     def __init__(self, bot):
         self.bot = bot
         self.logger = bot.logger
-        self._last_execution_time = 0
+        self._last_execution_time = float('-inf')
         
         # Per-user cooldown tracking (for commands that need per-user rate limiting)
         self._user_cooldowns: Dict[str, float] = {}
@@ -545,12 +553,10 @@ class BaseCommand(ABC):
         if self.cooldown_seconds <= 0:
             return True, 0.0
         
-        import time
-        
         if user_id:
             # Per-user cooldown
-            last_exec = self._user_cooldowns.get(user_id, 0)
-            elapsed = time.time() - last_exec
+            last_exec = self._user_cooldowns.get(user_id, float('-inf'))
+            elapsed = _monotonic() - last_exec
             remaining = self.cooldown_seconds - elapsed
             
             if remaining > 0:
@@ -558,7 +564,7 @@ class BaseCommand(ABC):
             return True, 0.0
         else:
             # Global cooldown (backward compatibility)
-            elapsed = time.time() - self._last_execution_time
+            elapsed = _monotonic() - self._last_execution_time
             remaining = self.cooldown_seconds - elapsed
             
             if remaining > 0:
@@ -571,20 +577,26 @@ class BaseCommand(ABC):
         Args:
             user_id: User ID to record execution for. If None, records global execution.
         """
-        import time
-        current_time = time.time()
+        current_time = _monotonic()
         
         if user_id:
-            # Per-user cooldown
-            self._user_cooldowns[user_id] = current_time
+            # Per-user cooldown (re-inserted so the dict stays ordered oldest -> newest)
+            cooldowns = self._user_cooldowns
+            cooldowns.pop(user_id, None)
+            cooldowns[user_id] = current_time
             
-            # Clean up old entries periodically to prevent memory growth
-            if len(self._user_cooldowns) > 1000:
-                cutoff = current_time - (self.cooldown_seconds * 2)
-                self._user_cooldowns = {
-                    k: v for k, v in self._user_cooldowns.items() 
-                    if v > cutoff
-                }
+            # Evict from the oldest end to bound memory: every stale entry, and
+            # least recently used ones while still over the size limit
+            excess = len(cooldowns) - self._USER_COOLDOWN_MAX_ENTRIES
+            if excess > 0:
+                cutoff = current_time - (self.cooldown_seconds * 8)
+                drop = 0
+                for last_exec in cooldowns.values():
+                    if drop >= excess and last_exec > cutoff:
+                        break
+                    drop += 1
+                for key in list(islice(cooldowns, drop)):
+                    del cooldowns[key]
         else:
             # Global cooldown (backward compatibility)
             self._last_execution_time = current_time
@@ -609,6 +621,23 @@ class BaseCommand(ABC):
         _, remaining = self.check_cooldown(user_id)
         return max(0, int(remaining))
     
+    def on_config_reloaded(self) -> None:
+        """Hook called after the bot reloads config.ini.
+        
+        Commands that cache values derived from the config should override this
+        to drop or rebuild those caches. The default implementation does nothing.
+        """
+        pass
+    
+    async def close(self) -> None:
+        """Release resources held by the command (e.g. HTTP sessions) on bot shutdown.
+        
+        Commands that call HTTP APIs should keep one aiohttp session, created lazily
+        in a _get_session() helper, rather than opening a session per request, and
+        close it here. The default implementation does nothing.
+        """
+        pass
+    
     def _load_translated_keywords(self):
         """Load translated keywords from translation files"""
         if not hasattr(self.bot, 'translator'):
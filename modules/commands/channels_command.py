@@ -6,11 +6,14 @@ Lists common hashtag channels for the region with multi-message support
 
 from .base_command import BaseCommand
 from ..models import MeshMessage
-from typing import Optional
-import asyncio
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
 import re
 
 
+_EMPTY_MAPPING: Mapping[str, str] = MappingProxyType({})
+
+
 class ChannelsCommand(BaseCommand):
     """Handles the channels command.
     
@@ -34,6 +37,14 @@ class ChannelsCommand(BaseCommand):
         {"name": "#channel", "description": "Get info on a specific channel"}
     ]
     
+    # "channel <arg>" / "channels <arg>" on normalized (stripped, lowercased) content
+    _SUBCOMMAND_PATTERN = re.compile(r'channels? (.*)', re.DOTALL)
+    
+    # Reserved sub-commands mapped to handler method names (handler(message) -> None)
+    _SUBCOMMAND_HANDLERS = {
+        'list': '_show_all_categories',
+    }
+    
     def __init__(self, bot):
         """Initialize the channels command.
         
@@ -42,6 +53,17 @@ class ChannelsCommand(BaseCommand):
         """
         super().__init__(bot)
         self.channels_enabled = self.get_config_value('Channels_Command', 'enabled', fallback=True, value_type='bool')
+        
+        # Parsed [Channels_List] index, built lazily and dropped on config reload
+        self._channel_index: Optional[Dict[str, Any]] = None
+        
+        # Last (raw content, stripped content, lowercased content) seen, so the
+        # matches_keyword() + execute() pair for one message normalizes it once
+        self._last_normalized: Tuple[Optional[str], str, str] = (None, '', '')
+        
+        # Pre-rendered list replies keyed by ('channels', sub_command) or ('categories', None);
+        # they only change with config or translations, so they are dropped on config reload
+        self._rendered_messages: Dict[Tuple[str, Optional[str]], Tuple[str, ...]] = {}
     
     def can_execute(self, message: MeshMessage) -> bool:
         """Check if this command can be executed with the given message.
@@ -59,6 +81,38 @@ class ChannelsCommand(BaseCommand):
     def get_help_text(self) -> str:
         return self.translate('commands.channels.help')
     
+    def _load_translated_keywords(self):
+        """Load translated keywords and rebuild the keyword lookup and pattern."""
+        super()._load_translated_keywords()
+        self._keywords_lower = frozenset(keyword.lower() for keyword in self.keywords)
+        # Custom word boundary that treats underscores as separators:
+        # (?<![a-zA-Z0-9]) / (?![a-zA-Z0-9]) reject adjacent alphanumerics only
+        alternatives = '|'.join(re.escape(keyword.lower()) for keyword in self.keywords)
+        self._keyword_pattern = re.compile(r'(?<![a-zA-Z0-9])(?:' + alternatives + r')(?![a-zA-Z0-9])')
+    
+    def on_config_reloaded(self) -> None:
+        """Drop the cached [Channels_List] index and rendered replies so they are rebuilt on next use."""
+        self._channel_index = None
+        self._rendered_messages = {}
+    
+    def _normalize_content(self, content: str) -> Tuple[str, str]:
+        """Strip whitespace and a leading '!' from message content.
+        
+        Args:
+            content: The raw message content.
+            
+        Returns:
+            Tuple[str, str]: (stripped content, lowercased stripped content).
+        """
+        last_raw, stripped, lowered = self._last_normalized
+        if content != last_raw:
+            stripped = content.strip()
+            if stripped.startswith('!'):
+                stripped = stripped[1:].strip()
+            lowered = stripped.lower()
+            self._last_normalized = (content, stripped, lowered)
+        return stripped, lowered
+    
     def matches_keyword(self, message: MeshMessage) -> bool:
         """Check if this command matches the message content based on keywords.
         
@@ -72,36 +126,17 @@ class ChannelsCommand(BaseCommand):
             return False
         
         # Strip exclamation mark if present (for command-style messages)
-        content = message.content.strip()
-        if content.startswith('!'):
-            content = content[1:].strip()
-        content_lower = content.lower()
+        _, content_lower = self._normalize_content(message.content)
         
-        # Don't match if this looks like a subcommand of another command
+        # Multi-word messages only match when the first word is the command itself
         # (e.g., "stats channels" should not match "channels" command)
         if ' ' in content_lower:
-            parts = content_lower.split()
-            if len(parts) > 1 and parts[0] not in ['channels', 'channel']:
-                return False
+            return content_lower.split(None, 1)[0] in ('channels', 'channel')
         
-        for keyword in self.keywords:
-            keyword_lower = keyword.lower()
-            
-            # Check for exact match first
-            if keyword_lower == content_lower:
-                return True
-            
-            # Check for word boundary matches using regex
-            # Create a regex pattern that matches the keyword at word boundaries
-            # Use custom word boundary that treats underscores as separators
-            # (?<![a-zA-Z0-9]) = negative lookbehind for alphanumeric characters (not underscore)
-            # (?![a-zA-Z0-9]) = negative lookahead for alphanumeric characters (not underscore)
-            # This allows underscores to act as word boundaries
-            pattern = r'(?<![a-zA-Z0-9])' + re.escape(keyword_lower) + r'(?![a-zA-Z0-9])'
-            if re.search(pattern, content_lower):
-                return True
-        
-        return False
+        # Single word: plain keyword lookup first, then word-boundary match (e.g. "channels?")
+        if content_lower in self._keywords_lower:
+            return True
+        return self._keyword_pattern.search(content_lower) is not None
     
     async def execute(self, message: MeshMessage) -> bool:
         """Execute the channels command.
@@ -114,39 +149,37 @@ class ChannelsCommand(BaseCommand):
         """
         try:
             # Parse the command to check for sub-commands
-            content = message.content.strip()
-            if content.startswith('!'):
-                content = content[1:].strip()
+            _, content_lower = self._normalize_content(message.content)
             
             # Check for sub-command (e.g., "channels seattle", "channel seahawks", "channels list", "channels #bot")
             sub_command = None
             specific_channel = None
-            if content.lower().startswith('channels ') or content.lower().startswith('channel '):
-                parts = content.split(' ', 1)
-                if len(parts) > 1:
-                    sub_command = parts[1].strip().lower()
-                    
-                    # Handle special "list" command to show all categories
-                    if sub_command == 'list':
-                        await self._show_all_categories(message)
-                        return True
-                    
-                    # Check if user is asking for a specific channel (starts with #)
-                    if sub_command.startswith('#'):
-                        specific_channel = sub_command
-                        sub_command = None
+            match = self._SUBCOMMAND_PATTERN.match(content_lower)
+            if match:
+                sub_command = match.group(1).strip()
+                
+                # Reserved sub-commands (e.g. "list" shows all categories)
+                handler_name = self._SUBCOMMAND_HANDLERS.get(sub_command)
+                if handler_name:
+                    await getattr(self, handler_name)(message)
+                    return True
+                
+                # Check if user is asking for a specific channel (starts with #)
+                if sub_command.startswith('#'):
+                    specific_channel = sub_command
+                    sub_command = None
+                else:
+                    # First check if this is a valid category
+                    if self._is_valid_category(sub_command):
+                        # It's a category, keep it as sub_command
+                        pass
                     else:
-                        # First check if this is a valid category
-                        if self._is_valid_category(sub_command):
-                            # It's a category, keep it as sub_command
-                            pass
-                        else:
-                            # Check if this might be a channel search (not a category)
-                            # Try to find a channel that matches this name across all categories
-                            found_channel = self._find_channel_by_name(sub_command)
-                            if found_channel:
-                                specific_channel = '#' + found_channel
-                                sub_command = None
+                        # Check if this might be a channel search (not a category)
+                        # Try to find a channel that matches this name across all categories
+                        found_channel = self._find_channel_by_name(sub_command)
+                        if found_channel:
+                            specific_channel = '#' + found_channel
+                            sub_command = None
             
             # Handle specific channel request
             if specific_channel:
@@ -163,15 +196,15 @@ class ChannelsCommand(BaseCommand):
                     await self.send_response(message, self.translate('commands.channels.no_channels_configured'))
                 return True
             
-            # Build channel list (names only, no descriptions)
-            channel_list = []
-            for channel_name, description in channels.items():
-                channel_list.append(channel_name)  # Just the channel name
-            
-            # Split into multiple messages if needed (130 character limit)
-            messages = self._split_into_messages(channel_list, sub_command)
+            # Channel names split into 130-character messages, rendered once per config load
+            key = ('channels', sub_command)
+            messages = self._rendered_messages.get(key)
+            if messages is None:
+                # Names only, no descriptions
+                messages = tuple(self._iter_split_messages(list(channels), sub_command))
+                self._rendered_messages[key] = messages
             
-            # Send each message with a small delay between them
+            # Send each message (spacing comes from the bot TX rate limiter)
             await self._send_multiple_messages(message, messages)
             
             return True
@@ -181,45 +214,22 @@ class ChannelsCommand(BaseCommand):
             await self.send_response(message, self.translate('commands.channels.error_retrieving_channels', error=str(e)))
             return False
     
-    def _load_channels_from_config(self, sub_command: str = None) -> dict:
+    def _load_channels_from_config(self, sub_command: str = None) -> Mapping[str, str]:
         """Load channels from the Channels_List config section with optional sub-command filtering.
         
         Args:
             sub_command: Optional category filter.
             
         Returns:
-            dict: Dictionary of channel names to descriptions.
+            Mapping[str, str]: Read-only mapping of channel names to descriptions.
         """
-        channels = {}
+        index = self._get_channel_index()
         
-        for channel_name, description in self._parse_config_channels():
-            # Handle sub-command filtering
-            if sub_command:
-                # Special case: "general" should show general channels (no category prefix)
-                if sub_command == 'general':
-                    # For general channels, only show channels that don't have sub-command prefixes
-                    if '.' in channel_name:
-                        continue
-                    display_name = channel_name
-                else:
-                    # Check if this channel belongs to the sub-command
-                    if not channel_name.startswith(f'{sub_command}.'):
-                        continue
-                    # Remove the sub-command prefix for display
-                    display_name = channel_name[len(sub_command) + 1:]  # Remove 'subcommand.'
-            else:
-                # For general channels, only show channels that don't have sub-command prefixes
-                if '.' in channel_name:
-                    continue
-                display_name = channel_name
-            
-            # Add # prefix if not already present
-            if not display_name.startswith('#'):
-                display_name = '#' + display_name
-            
-            channels[display_name] = description
+        # Special case: "general" should show general channels (no category prefix)
+        if not sub_command or sub_command == 'general':
+            return index['general']
         
-        return channels
+        return index['by_category'].get(sub_command, _EMPTY_MAPPING)
     
     async def _show_all_categories(self, message: MeshMessage) -> None:
         """Show all available channel categories.
@@ -234,46 +244,34 @@ class ChannelsCommand(BaseCommand):
                 await self.send_response(message, self.translate('commands.channels.no_categories_configured'))
                 return
             
-            # Build category list
-            category_list = []
-            for category, count in categories.items():
-                category_list.append(self.translate('commands.channels.category_count', category=category, count=count))
-            
-            # Split into multiple messages if needed
-            messages = self._split_into_messages(category_list, "Available categories")
+            messages = self._rendered_messages.get(('categories', None))
+            if messages is None:
+                # Build category list
+                category_list = []
+                for category, count in categories.items():
+                    category_list.append(self.translate('commands.channels.category_count', category=category, count=count))
+                
+                # Split into multiple messages if needed
+                messages = tuple(self._iter_split_messages(category_list, "Available categories"))
+                self._rendered_messages[('categories', None)] = messages
             
-            # Send each message with a small delay between them
+            # Send each message (spacing comes from the bot TX rate limiter)
             await self._send_multiple_messages(message, messages)
                 
         except Exception as e:
             self.logger.error(f"Error showing categories: {e}")
             await self.send_response(message, self.translate('commands.channels.error_retrieving_categories', error=str(e)))
     
-    def _get_all_categories(self) -> dict:
+    def _get_all_categories(self) -> Mapping[str, int]:
         """Get all available channel categories and their channel counts.
         
         Returns:
-            dict: Dictionary mapping category names to channel counts.
+            Mapping[str, int]: Read-only mapping of category names to channel counts.
         """
-        categories = {}
-        
-        for channel_name, description in self._parse_config_channels():
-            # Check if this is a sub-command channel (has a dot)
-            if '.' in channel_name:
-                category = channel_name.split('.')[0]
-                if category not in categories:
-                    categories[category] = 0
-                categories[category] += 1
-            else:
-                # General channels (no category)
-                if 'general' not in categories:
-                    categories['general'] = 0
-                categories['general'] += 1
-        
-        return categories
+        return self._get_channel_index()['categories']
     
     def _find_channel_by_name(self, search_name: str) -> Optional[str]:
-        """Find a channel by partial name match across all categories.
+        """Find a channel by name across all categories.
         
         Args:
             search_name: The channel name to search for.
@@ -281,21 +279,8 @@ class ChannelsCommand(BaseCommand):
         Returns:
             Optional[str]: The full channel name if found, None otherwise.
         """
-        search_name_lower = search_name.lower()
-        
-        for config_name, description in self._parse_config_channels():
-            # Handle sub-command channels
-            if '.' in config_name:
-                category, name = config_name.split('.', 1)
-                # Check if the channel name matches (case insensitive)
-                if name.lower() == search_name_lower:
-                    return name
-            else:
-                # Check general channels
-                if config_name.lower() == search_name_lower:
-                    return config_name
-        
-        return None
+        entry = self._get_channel_index()['by_name_lower'].get(search_name.lower())
+        return entry[0] if entry else None
     
     async def _show_specific_channel(self, message: MeshMessage, channel_name: str) -> None:
         """Show description for a specific channel.
@@ -305,38 +290,14 @@ class ChannelsCommand(BaseCommand):
             channel_name: The channel name to show info for.
         """
         try:
-            # Search for the channel in all categories
-            found_channel = None
-            found_category = None
+            channel_name_lower = channel_name.lower()
+            entry = None
+            if channel_name_lower.startswith('#'):
+                entry = self._get_channel_index()['by_name_lower'].get(channel_name_lower[1:])
             
-            for config_name, description in self._parse_config_channels():
-                # Handle sub-command channels
-                if '.' in config_name:
-                    category, name = config_name.split('.', 1)
-                    display_name = '#' + name
-                else:
-                    display_name = '#' + config_name
-                
-                # Check if this matches the requested channel
-                if display_name.lower() == channel_name.lower():
-                    found_channel = display_name
-                    found_category = category if '.' in config_name else 'general'
-                    break
-            
-            if found_channel:
-                # Get the description
-                if found_category == 'general':
-                    config_key = found_channel[1:]  # Remove #
-                else:
-                    config_key = f"{found_category}.{found_channel[1:]}"  # Remove #
-                
-                description = self.bot.config.get('Channels_List', config_key, fallback=self.translate('commands.channels.no_description_available'))
-                
-                # Strip quotes if present
-                if description.startswith('"') and description.endswith('"'):
-                    description = description[1:-1]
-                
-                response = f"{found_channel}: {description}"
+            if entry:
+                name, description = entry
+                response = f"#{name}: {description}"
                 await self.send_response(message, response)
             else:
                 await self.send_response(message, self.translate('commands.channels.channel_not_found', channel=channel_name))
@@ -355,53 +316,65 @@ class ChannelsCommand(BaseCommand):
         Returns:
             list: List of message strings ready for sending.
         """
-        messages = []
+        return list(self._iter_split_messages(channel_list, sub_command))
+    
+    def _iter_split_messages(self, channel_list: list, sub_command: str = None) -> Iterator[str]:
+        """Yield channel list messages of at most 130 characters one at a time.
+        
+        Lets the caller send each message as soon as it is built instead of
+        splitting the whole list up front.
+        
+        Args:
+            channel_list: List of channel string items.
+            sub_command: The current sub-command/category context.
+            
+        Yields:
+            str: Message strings ready for sending.
+        """
+        produced = False
         
-        # Set appropriate header based on sub-command
-        current_message = self._get_header_for_subcommand(sub_command)
-        current_length = len(current_message)
+        # Set appropriate header based on sub-command; later messages use the continuation header
+        header = self._get_header_for_subcommand(sub_command)
+        channels_cont = None
+        
+        # Collect items per message and join once, tracking the length as we go
+        items = []
+        current_length = len(header)
         
         for channel in channel_list:
             # Check if adding this channel would exceed the limit
             if current_length + len(channel) + 2 > 130:  # +2 for ", " separator
-                # Start a new message
-                expected_header = self._get_continuation_header_for_subcommand(sub_command)
-                
-                if current_message != expected_header:
-                    messages.append(current_message.rstrip(", "))
-                    current_message = self.translate('commands.channels.headers.channels_cont')
-                    current_length = len(current_message)
+                if channels_cont is None:
+                    channels_cont = self.translate('commands.channels.headers.channels_cont')
+                produced = True
+                if items:
+                    # Start a new message
+                    yield header + ", ".join(items)
+                    items = []
                 else:
                     # If even the first channel is too long, just send it alone
-                    messages.append(f"{expected_header}{channel}")
-                    current_message = self.translate('commands.channels.headers.channels_cont')
-                    current_length = len(current_message)
+                    yield header + channel
+                    header = channels_cont
+                    current_length = len(header)
                     continue
+                header = channels_cont
+                current_length = len(header)
             
             # Add channel to current message
-            initial_header = self._get_header_for_subcommand(sub_command)
-            continuation_header = self._get_continuation_header_for_subcommand(sub_command)
-            channels_cont = self.translate('commands.channels.headers.channels_cont')
-            if current_message == initial_header or current_message == continuation_header or current_message == channels_cont:
-                current_message += channel
-            else:
-                current_message += f", {channel}"
-            current_length = len(current_message)
+            if items:
+                current_length += 2
+            items.append(channel)
+            current_length += len(channel)
         
         # Add the last message if it has content
-        header = self._get_continuation_header_for_subcommand(sub_command)
-        channels_cont = self.translate('commands.channels.headers.channels_cont')
-        if current_message != header and current_message != channels_cont:
-            messages.append(current_message)
-        
-        # If no messages were created, send a default message
-        if not messages:
+        if items:
+            yield header + ", ".join(items)
+        elif not produced:
+            # If no messages were created, send a default message
             if sub_command:
-                messages.append(self.translate('commands.channels.no_category_channels', category=sub_command))
+                yield self.translate('commands.channels.no_category_channels', category=sub_command)
             else:
-                messages.append(self.translate('commands.channels.no_channels_configured'))
-        
-        return messages
+                yield self.translate('commands.channels.no_channels_configured')
     
     def _get_header_for_subcommand(self, sub_command: str = None) -> str:
         """Get the appropriate header for a sub-command.
@@ -419,33 +392,17 @@ class ChannelsCommand(BaseCommand):
         else:
             return self.translate('commands.channels.headers.common_channels')
     
-    def _get_continuation_header_for_subcommand(self, sub_command: str = None) -> str:
-        """Get the appropriate header for continuation messages.
+    async def _send_multiple_messages(self, message: MeshMessage, messages: Iterable[str]) -> None:
+        """Send multiple messages in order.
         
-        Args:
-            sub_command: The sub-command/category name.
-            
-        Returns:
-            str: Continuation header string.
-        """
-        if sub_command == "Available categories":
-            return self.translate('commands.channels.headers.available_categories')
-        elif sub_command and sub_command != "general":
-            return self.translate('commands.channels.headers.category_channels', category=sub_command.title())
-        else:
-            return self.translate('commands.channels.headers.common_channels_cont')
-    
-    async def _send_multiple_messages(self, message: MeshMessage, messages: list) -> None:
-        """Send multiple messages with delays between them.
+        Spacing between messages comes from the bot TX rate limiter, which
+        send_response waits on before every transmission.
         
         Args:
             message: The original command message.
-            messages: List of message strings to send.
+            messages: Message strings to send (a list or a lazy iterator).
         """
         for i, msg_content in enumerate(messages):
-            if i > 0:
-                # Small delay between messages to prevent overwhelming the network
-                await asyncio.sleep(0.5)
             # Per-user rate limit applies only to first message (trigger); skip for continuations
             await self.send_response(message, msg_content, skip_user_rate_limit=(i > 0))
     
@@ -455,10 +412,11 @@ class ChannelsCommand(BaseCommand):
         Yields:
             tuple: (channel_name, description) pairs.
         """
-        if not self.bot.config.has_section('Channels_List'):
+        config = self.bot.config
+        if not config.has_section('Channels_List'):
             return
         
-        for channel_name, description in self.bot.config.items('Channels_List'):
+        for channel_name, description in config.items('Channels_List'):
             # Skip empty or commented lines
             if channel_name.strip() and not channel_name.startswith('#'):
                 # Strip quotes if present
@@ -466,6 +424,61 @@ class ChannelsCommand(BaseCommand):
                     description = description[1:-1]
                 yield channel_name, description
     
+    def _get_channel_index(self) -> Dict[str, Any]:
+        """Get the parsed [Channels_List] index, building it on first use.
+        
+        Returns:
+            Dict[str, Any]: Index with 'general' and 'by_category' channel maps
+                ('#name' -> description), 'categories' (category -> channel count)
+                'categories_lower' (lowercased category names) and 'by_name_lower'
+                (lowercased channel name -> (name, description), across all categories).
+        """
+        if self._channel_index is None:
+            self._channel_index = self._build_channel_index()
+        return self._channel_index
+    
+    def _build_channel_index(self) -> Dict[str, Any]:
+        """Parse [Channels_List] once into read-only lookup tables.
+        
+        The tables are wrapped in MappingProxyType so callers can be handed
+        them directly without copying.
+        
+        Returns:
+            Dict[str, Any]: The channel index (see _get_channel_index).
+        """
+        general: Dict[str, str] = {}
+        by_category: Dict[str, Dict[str, str]] = {}
+        categories: Dict[str, int] = {}
+        by_name_lower: Dict[str, Tuple[str, str]] = {}
+        
+        for channel_name, description in self._parse_config_channels():
+            if '.' in channel_name:
+                category, display_name = channel_name.split('.', 1)
+                channels = by_category.setdefault(category, {})
+            else:
+                # General channels (no category)
+                category, display_name = 'general', channel_name
+                channels = general
+            
+            # First entry wins when the same name appears in several categories
+            by_name_lower.setdefault(display_name.lower(), (display_name, description))
+            
+            # Add # prefix if not already present
+            if not display_name.startswith('#'):
+                display_name = '#' + display_name
+            channels[display_name] = description
+            categories[category] = categories.get(category, 0) + 1
+        
+        return {
+            'general': MappingProxyType(general),
+            'by_category': MappingProxyType(
+                {category: MappingProxyType(channels) for category, channels in by_category.items()}
+            ),
+            'categories': MappingProxyType(categories),
+            'categories_lower': frozenset(c.lower() for c in by_category),
+            'by_name_lower': MappingProxyType(by_name_lower),
+        }
+    
     def _is_valid_category(self, category_name: str) -> bool:
         """Check if a category name is valid (has channels with that prefix).
         
@@ -478,11 +491,4 @@ class ChannelsCommand(BaseCommand):
         if not category_name:
             return False
         
-        # Check if there are any channels with this category prefix
-        for channel_name, description in self._parse_config_channels():
-            if '.' in channel_name:
-                category = channel_name.split('.')[0]
-                if category.lower() == category_name.lower():
-                    return True
-        
-        return False
+        return category_name.lower() in self._get_channel_index()['categories_lower']
@@ -7,10 +7,17 @@ Fetches dad jokes from icanhazdadjoke.com API
 import asyncio
 import aiohttp
 import logging
+import random
+import re
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from .base_command import BaseCommand
 from ..models import MeshMessage
 
+# Logical split points for long jokes: sentence or clause punctuation followed by a space
+_SPLIT_POINT_PATTERN = re.compile(r'[.?!,] ')
+
 logger = logging.getLogger("MeshCoreBot")
 
 class DadJokeCommand(BaseCommand):
@@ -32,6 +39,12 @@ class DadJokeCommand(BaseCommand):
     # API configuration
     DAD_JOKE_API_URL = "https://icanhazdadjoke.com/"
     TIMEOUT = 10  # seconds
+    HEADERS = {
+        'Accept': 'application/json',
+        'User-Agent': 'MeshCoreBot (https://github.com/adam/meshcore-bot)'
+    }
+    JOKE_CACHE_SIZE = 50  # Recently fetched jokes kept for bursts of requests
+    FETCH_BATCHES = (1, 4)  # Concurrent API requests per round when looking for a short joke
     
     def __init__(self, bot):
         """Initialize the dadjoke command.
@@ -46,6 +59,39 @@ class DadJokeCommand(BaseCommand):
         if self.dadjoke_enabled is None:
             self.dadjoke_enabled = self.get_config_value('DadJoke_Command', 'dadjoke_enabled', fallback=True, value_type='bool')
         self.long_jokes = self.get_config_value('DadJoke_Command', 'long_jokes', fallback=False, value_type='bool')
+        
+        # Serve from recently fetched jokes (instead of the API) while the cache is full
+        # and the last fetch is younger than this many seconds; 0 disables
+        self.cache_refill_seconds = self.get_config_value('DadJoke_Command', 'cache_refill_seconds', fallback=10.0, value_type='float')
+        # Chance (0-1) of answering from cached jokes even when the cache is not fresh; 0 disables
+        self.cache_hit_probability = self.get_config_value('DadJoke_Command', 'cache_hit_probability', fallback=0.0, value_type='float')
+        
+        # HTTP session reused across requests (created lazily in the running event loop)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Recently fetched jokes keyed by joke id (oldest first) and when the API was last hit (monotonic)
+        self._joke_cache: OrderedDict = OrderedDict()
+        self._last_fetch_time = float('-inf')
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp session used for API requests.
+        
+        Returns:
+            aiohttp.ClientSession: Session with the API headers and timeout applied.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.TIMEOUT),
+                connector=aiohttp.TCPConnector(limit_per_host=4, ttl_dns_cache=300)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     def get_help_text(self) -> str:
         """Get help text for the dadjoke command.
@@ -55,6 +101,13 @@ class DadJokeCommand(BaseCommand):
         """
         return "Usage: dadjoke - Get a random dad joke"
     
+    def _load_translated_keywords(self):
+        """Load translated keywords and precompute the lowercased match tables."""
+        super()._load_translated_keywords()
+        keywords_lower = [keyword.lower() for keyword in self.keywords]
+        self._keywords_lower = frozenset(keywords_lower)
+        self._keyword_prefixes = tuple(keyword + ' ' for keyword in keywords_lower)
+    
     def matches_keyword(self, message: MeshMessage) -> bool:
         """Check if message starts with a dad joke keyword.
         
@@ -68,11 +121,8 @@ class DadJokeCommand(BaseCommand):
         if content.startswith('!'):
             content = content[1:].strip()
         content_lower = content.lower()
-        for keyword in self.keywords:
-            # Match if keyword is at start followed by space or end of message
-            if content_lower == keyword or content_lower.startswith(keyword + ' '):
-                return True
-        return False
+        # Match if keyword is at start followed by space or end of message
+        return content_lower in self._keywords_lower or content_lower.startswith(self._keyword_prefixes)
     
     def can_execute(self, message: MeshMessage) -> bool:
         """Override to add custom check (dadjoke_enabled) while using base class cooldown.
@@ -83,15 +133,12 @@ class DadJokeCommand(BaseCommand):
         Returns:
             bool: True if the command can be executed, False otherwise.
         """
-        # Use base class for channel access, DM requirements, and cooldown
-        if not super().can_execute(message):
-            return False
-        
-        # Check if dadjoke command is enabled
+        # Check if dadjoke command is enabled (cheap flag first, before the base checks)
         if not self.dadjoke_enabled:
             return False
         
-        return True
+        # Use base class for channel access, DM requirements, and cooldown
+        return super().can_execute(message)
     
     async def execute(self, message: MeshMessage) -> bool:
         """Execute the dad joke command.
@@ -130,38 +177,31 @@ class DadJokeCommand(BaseCommand):
             Optional[Dict[str, Any]]: The JSON response from the API, or None if failed.
         """
         try:
-            headers = {
-                'Accept': 'application/json',
-                'User-Agent': 'MeshCoreBot (https://github.com/adam/meshcore-bot)'
-            }
-            
             self.logger.debug(f"Fetching dad joke from: {self.DAD_JOKE_API_URL}")
             
             # Make the API request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.DAD_JOKE_API_URL, 
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=self.TIMEOUT)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Check if the API returned an error
-                        if data.get('status') != 200:
-                            self.logger.warning(f"Dad joke API returned error status: {data.get('status')}")
-                            return None
-                        
-                        # Validate required fields
-                        if not data.get('joke'):
-                            self.logger.warning("Dad joke API returned joke without content")
-                            return None
-                        
-                        return data
-                    else:
-                        self.logger.error(f"Dad joke API returned status {response.status}")
+            session = await self._get_session()
+            async with session.get(self.DAD_JOKE_API_URL) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    
+                    # Check if the API returned an error
+                    if data.get('status') != 200:
+                        self.logger.warning(f"Dad joke API returned error status: {data.get('status')}")
+                        return None
+                    
+                    # Validate required fields
+                    if not data.get('joke'):
+                        self.logger.warning("Dad joke API returned joke without content")
                         return None
-                        
+                    
+                    self._cache_joke(data)
+                    self._last_fetch_time = time.monotonic()
+                    return data
+                else:
+                    self.logger.error(f"Dad joke API returned status {response.status}")
+                    return None
+                    
         except asyncio.TimeoutError:
             self.logger.error("Timeout fetching dad joke from API")
             return None
@@ -175,32 +215,77 @@ class DadJokeCommand(BaseCommand):
         Returns:
             Optional[Dict[str, Any]]: The JSON response from the API, or None if failed.
         """
-        max_attempts = 5  # Prevent infinite loops
+        cached = self._get_cached_joke()
+        if cached is not None:
+            return cached
         
-        for attempt in range(max_attempts):
-            joke_data = await self.get_dad_joke_from_api()
-            
-            if joke_data is None:
+        if self.long_jokes:
+            # Any length works; long jokes are split when sent
+            return await self.get_dad_joke_from_api()
+        
+        # Most jokes fit, so try one first; if it is too long, fetch the remaining
+        # attempts concurrently instead of one round trip at a time
+        joke_data = None
+        attempts = 0
+        for batch_size in self.FETCH_BATCHES:
+            results = await asyncio.gather(*(self.get_dad_joke_from_api() for _ in range(batch_size)))
+            attempts += batch_size
+            jokes = [joke for joke in results if joke is not None]
+            if not jokes:
                 return None
             
-            # Check joke length
-            joke_text = self.format_dad_joke(joke_data)
-            
-            if len(joke_text) <= 130:
+            for joke in jokes:
                 # Joke is short enough, return it
-                return joke_data
-            elif self.long_jokes:
-                # Long jokes are enabled, return it for splitting
-                return joke_data
-            else:
-                # Long jokes are disabled, try again
-                self.logger.debug(f"Dad joke too long ({len(joke_text)} chars), fetching another...")
-                continue
+                if len(self.format_dad_joke(joke)) <= 130:
+                    return joke
+            joke_data = jokes[-1]
+            self.logger.debug(f"Dad joke too long ({len(self.format_dad_joke(joke_data))} chars), fetching more...")
         
-        # If we've tried max_attempts times and still getting long jokes, return the last one
-        self.logger.warning(f"Could not get short dad joke after {max_attempts} attempts")
+        # If we've tried every attempt and still only got long jokes, return the last one
+        self.logger.warning(f"Could not get short dad joke after {attempts} attempts")
         return joke_data
     
+    def _cache_joke(self, joke_data: Dict[str, Any]) -> None:
+        """Remember a fetched joke, evicting the oldest once the cache is full.
+        
+        Jokes are keyed by their API id, so a joke the API repeats is refreshed
+        instead of being stored twice.
+        
+        Args:
+            joke_data: The joke data from the API.
+        """
+        joke_id = joke_data.get('id') or joke_data['joke']
+        self._joke_cache.pop(joke_id, None)
+        self._joke_cache[joke_id] = joke_data
+        if len(self._joke_cache) > self.JOKE_CACHE_SIZE:
+            self._joke_cache.popitem(last=False)
+    
+    def _get_cached_joke(self) -> Optional[Dict[str, Any]]:
+        """Pick a previously fetched joke instead of querying the API.
+        
+        Used while the cache is full and still fresh, or otherwise with
+        cache_hit_probability chance.
+        
+        Returns:
+            Optional[Dict[str, Any]]: A cached joke that satisfies the length setting,
+                or None if the API should be queried.
+        """
+        if not self._joke_cache:
+            return None
+        fresh = (
+            self.cache_refill_seconds > 0
+            and len(self._joke_cache) >= self.JOKE_CACHE_SIZE
+            and time.monotonic() - self._last_fetch_time < self.cache_refill_seconds
+        )
+        if not fresh and not (self.cache_hit_probability > 0 and random.random() < self.cache_hit_probability):
+            return None
+        
+        if self.long_jokes:
+            candidates = list(self._joke_cache.values())
+        else:
+            candidates = [j for j in self._joke_cache.values() if len(self.format_dad_joke(j)) <= 130]
+        return random.choice(candidates) if candidates else None
+    
     async def send_dad_joke_with_length_handling(self, message: MeshMessage, joke_data: Dict[str, Any]) -> None:
         """Send dad joke with length handling - split if necessary.
         
@@ -229,6 +314,9 @@ class DadJokeCommand(BaseCommand):
     def split_dad_joke(self, joke_text: str) -> list:
         """Split a long dad joke at a logical point.
         
+        Prefers the sentence or clause break (". ", "? ", "! ", ", ") closest to
+        the middle of the joke, so both halves are likely to fit in a message.
+        
         Args:
             joke_text: The long joke text to split.
             
@@ -237,29 +325,21 @@ class DadJokeCommand(BaseCommand):
         """
         # Remove emoji for splitting
         clean_joke = joke_text[2:] if joke_text.startswith('🥸 ') else joke_text
+        mid_point = len(clean_joke) // 2
         
-        # Try to split at common logical points
-        split_points = [
-            '. ',     # Period followed by space
-            '? ',     # Question mark followed by space
-            '! ',     # Exclamation mark followed by space
-            ', ',     # Comma followed by space
-        ]
-        
-        for split_point in split_points:
-            if split_point in clean_joke:
-                parts = clean_joke.split(split_point, 1)
-                if len(parts) == 2:
-                    # Add emoji back to both parts
-                    return [f"🥸 {parts[0]}{split_point}", f"🥸 {parts[1]}"]
+        best = min(
+            _SPLIT_POINT_PATTERN.finditer(clean_joke),
+            key=lambda match: abs(match.end() - mid_point),
+            default=None,
+        )
+        if best is not None:
+            # Punctuation stays with the first part; add emoji back to both parts
+            return [f"🥸 {clean_joke[:best.start() + 1]}", f"🥸 {clean_joke[best.end():]}"]
         
-        # If no good split point found, split at middle
-        mid_point = len(clean_joke) // 2
-        # Find nearest space to avoid splitting words
-        for i in range(mid_point, len(clean_joke)):
-            if clean_joke[i] == ' ':
-                mid_point = i
-                break
+        # If no good split point found, split at the first space from the middle to avoid splitting words
+        space = clean_joke.find(' ', mid_point)
+        if space != -1:
+            mid_point = space
         
         part1 = clean_joke[:mid_point]
         part2 = clean_joke[mid_point + 1:]
@@ -275,14 +355,11 @@ class DadJokeCommand(BaseCommand):
         Returns:
             str: The formatted joke string.
         """
-        try:
-            joke = joke_data.get('joke', '')
-            
-            if joke:
-                return f"🥸 {joke}"
-            else:
-                return "🥸 No dad joke content available"
-                    
-        except Exception as e:
-            self.logger.error(f"Error formatting dad joke: {e}")
-            return "🥸 Sorry, couldn't format the dad joke properly!"
+        # Cached jokes are length-checked on every cache pick, so keep the result on the dict
+        formatted = joke_data.get('_formatted')
+        if formatted is None:
+            # get_dad_joke_from_api() only returns (and caches) jokes with content
+            joke = joke_data.get('joke')
+            formatted = f"🥸 {joke}" if joke else "🥸 No dad joke content available"
+            joke_data['_formatted'] = formatted
+        return formatted
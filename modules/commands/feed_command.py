@@ -4,13 +4,18 @@ Feed command for the MeshCore Bot
 Handles RSS and API feed subscription management
 """
 
+import asyncio
+import functools
 import json
 import re
+import sqlite3
 from typing import Optional, List, Dict, Any
-from urllib.parse import urlparse
 from .base_command import BaseCommand
 from ..models import MeshMessage
 
+# http(s) URL with a non-empty host part (what "feed subscribe" and "feed test" accept)
+_URL_PATTERN = re.compile(r'https?://[^\s/?#]+(?:[/?#]\S*)?', re.IGNORECASE)
+
 
 class FeedCommand(BaseCommand):
     """Handles feed subscription management"""
@@ -24,6 +29,20 @@ class FeedCommand(BaseCommand):
     cooldown_seconds = 2
     requires_internet = True  # Requires internet access for RSS/API feed fetching
     
+    LIST_PAGE_SIZE = 10  # Subscriptions shown by "feed list" (mesh message size)
+    
+    # Sub-commands mapped to handler method names (handler(message, args) -> bool)
+    _SUBCOMMAND_HANDLERS = {
+        'subscribe': '_handle_subscribe',
+        'unsubscribe': '_handle_unsubscribe',
+        'list': '_handle_list',
+        'status': '_handle_status',
+        'test': '_handle_test',
+        'enable': '_handle_enable',
+        'disable': '_handle_disable',
+        'update': '_handle_update',
+    }
+    
     def __init__(self, bot):
         super().__init__(bot)
         self.db_path = bot.db_manager.db_path
@@ -41,6 +60,15 @@ class FeedCommand(BaseCommand):
         """Feed command requires admin access"""
         return True
     
+    async def _run_db(self, func, *args, **kwargs):
+        """Run a blocking subscription DB helper in the default executor.
+        
+        Keeps SQLite I/O (and any lock wait) off the event loop so message
+        handling continues while the query runs.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+    
     async def execute(self, message: MeshMessage) -> bool:
         """Execute the feed command"""
         content = message.content.strip()
@@ -54,26 +82,10 @@ class FeedCommand(BaseCommand):
         if len(parts) < 2:
             return await self.send_response(message, self.get_help_text())
         
-        subcommand = parts[1].lower()
-        
-        if subcommand == 'subscribe':
-            return await self._handle_subscribe(message, parts[2:])
-        elif subcommand == 'unsubscribe':
-            return await self._handle_unsubscribe(message, parts[2:])
-        elif subcommand == 'list':
-            return await self._handle_list(message, parts[2:])
-        elif subcommand == 'status':
-            return await self._handle_status(message, parts[2:])
-        elif subcommand == 'test':
-            return await self._handle_test(message, parts[2:])
-        elif subcommand == 'enable':
-            return await self._handle_enable_disable(message, parts[2:], True)
-        elif subcommand == 'disable':
-            return await self._handle_enable_disable(message, parts[2:], False)
-        elif subcommand == 'update':
-            return await self._handle_update(message, parts[2:])
-        else:
+        handler_name = self._SUBCOMMAND_HANDLERS.get(parts[1].lower())
+        if handler_name is None:
             return await self.send_response(message, self.get_help_text())
+        return await getattr(self, handler_name)(message, parts[2:])
     
     def get_help_text(self) -> str:
         """Get help text for feed command"""
@@ -126,7 +138,8 @@ feed status 1"""
         
         # Create subscription
         try:
-            feed_id = self._create_subscription(
+            feed_id = await self._run_db(
+                self._create_subscription,
                 feed_type=feed_type,
                 feed_url=feed_url,
                 channel_name=channel_name,
@@ -156,11 +169,11 @@ feed status 1"""
             # Try as ID first
             try:
                 feed_id = int(identifier)
-                success = self._delete_subscription_by_id(feed_id)
+                success = await self._run_db(self._delete_subscription_by_id, feed_id)
             except ValueError:
                 # Try as URL
                 if channel_name:
-                    success = self._delete_subscription_by_url(identifier, channel_name)
+                    success = await self._run_db(self._delete_subscription_by_url, identifier, channel_name)
                 else:
                     return await self.send_response(message, "Channel name required when using URL")
             
@@ -178,7 +191,8 @@ feed status 1"""
         channel_filter = args[0] if args else None
         
         try:
-            feeds = self._get_subscriptions(channel_filter)
+            # Only fetch what fits in a mesh message; count the rest only when the page is full
+            feeds = await self._run_db(self._get_subscriptions, channel_filter, self.LIST_PAGE_SIZE)
             
             if not feeds:
                 response = "No feed subscriptions"
@@ -186,14 +200,18 @@ feed status 1"""
                     response += f" for channel '{channel_filter}'"
                 return await self.send_response(message, response)
             
-            response = f"Feed Subscriptions ({len(feeds)}):\n"
-            for feed in feeds[:10]:  # Limit to 10 for mesh message
+            total = len(feeds)
+            if total == self.LIST_PAGE_SIZE:
+                total = await self._run_db(self._count_subscriptions, channel_filter)
+            
+            response = f"Feed Subscriptions ({total}):\n"
+            for feed in feeds:
                 status = "enabled" if feed['enabled'] else "disabled"
-                name = feed.get('feed_name') or feed['feed_url'][:30]
+                name = feed['feed_name'] or feed['feed_url'][:30]
                 response += f"{feed['id']}. {name} ({feed['feed_type']}) -> {feed['channel_name']} [{status}]\n"
             
-            if len(feeds) > 10:
-                response += f"({len(feeds) - 10} more...)"
+            if total > len(feeds):
+                response += f"({total - len(feeds)} more...)"
             
             return await self.send_response(message, response)
         
@@ -208,7 +226,7 @@ feed status 1"""
         
         try:
             feed_id = int(args[0])
-            feed = self._get_subscription_by_id(feed_id)
+            feed = await self._run_db(self._get_subscription_by_id, feed_id)
             
             if not feed:
                 return await self.send_response(message, f"Feed subscription {feed_id} not found")
@@ -249,6 +267,14 @@ feed status 1"""
         # For now, just validate URL
         return await self.send_response(message, f"URL validated: {feed_url}\n(Full test requires feed manager)")
     
+    async def _handle_enable(self, message: MeshMessage, args: List[str]) -> bool:
+        """Handle enable command"""
+        return await self._handle_enable_disable(message, args, True)
+    
+    async def _handle_disable(self, message: MeshMessage, args: List[str]) -> bool:
+        """Handle disable command"""
+        return await self._handle_enable_disable(message, args, False)
+    
     async def _handle_enable_disable(self, message: MeshMessage, args: List[str], enable: bool) -> bool:
         """Handle enable/disable command"""
         if not args:
@@ -256,7 +282,7 @@ feed status 1"""
         
         try:
             feed_id = int(args[0])
-            success = self._set_subscription_enabled(feed_id, enable)
+            success = await self._run_db(self._set_subscription_enabled, feed_id, enable)
             
             if success:
                 status = "enabled" if enable else "disabled"
@@ -279,7 +305,7 @@ feed status 1"""
             feed_id = int(args[0])
             interval = int(args[1]) if len(args) > 1 else None
             
-            success = self._update_subscription(feed_id, interval)
+            success = await self._run_db(self._update_subscription, feed_id, interval)
             
             if success:
                 response = f"Feed {feed_id} updated"
@@ -297,17 +323,11 @@ feed status 1"""
     
     def _validate_url(self, url: str) -> bool:
         """Validate URL format"""
-        try:
-            result = urlparse(url)
-            return all([result.scheme in ['http', 'https'], result.netloc])
-        except Exception:
-            return False
+        return _URL_PATTERN.fullmatch(url) is not None
     
     def _create_subscription(self, feed_type: str, feed_url: str, channel_name: str,
                             feed_name: Optional[str] = None, api_config: Optional[Dict] = None) -> int:
         """Create a new feed subscription"""
-        import sqlite3
-        
         with self.bot.db_manager.connection() as conn:
             cursor = conn.cursor()
             
@@ -327,8 +347,6 @@ feed status 1"""
     
     def _delete_subscription_by_id(self, feed_id: int) -> bool:
         """Delete subscription by ID"""
-        import sqlite3
-        
         with self.bot.db_manager.connection() as conn:
             cursor = conn.cursor()
             cursor.execute('DELETE FROM feed_subscriptions WHERE id = ?', (feed_id,))
@@ -337,8 +355,6 @@ feed status 1"""
     
     def _delete_subscription_by_url(self, feed_url: str, channel_name: str) -> bool:
         """Delete subscription by URL and channel"""
-        import sqlite3
-        
         with self.bot.db_manager.connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
@@ -348,35 +364,50 @@ feed status 1"""
             conn.commit()
             return cursor.rowcount > 0
     
-    def _get_subscriptions(self, channel_filter: Optional[str] = None) -> List[Dict]:
-        """Get all subscriptions, optionally filtered by channel"""
-        import sqlite3
+    def _get_subscriptions(self, channel_filter: Optional[str] = None,
+                           limit: Optional[int] = None, offset: int = 0) -> List[sqlite3.Row]:
+        """Get subscriptions ordered by ID, optionally filtered by channel and paged.
         
+        Only the columns shown by "feed list" are selected (id, enabled, feed_name,
+        feed_url, feed_type, channel_name); use _get_subscription_by_id() for the full row.
+        """
         with self.bot.db_manager.connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
+            # SQLite treats a negative LIMIT as "no limit"
+            page = (-1 if limit is None else limit, offset)
             if channel_filter:
                 cursor.execute('''
-                    SELECT * FROM feed_subscriptions
+                    SELECT id, enabled, feed_name, feed_url, feed_type, channel_name
+                    FROM feed_subscriptions
                     WHERE channel_name = ?
                     ORDER BY id
-                ''', (channel_filter,))
+                    LIMIT ? OFFSET ?
+                ''', (channel_filter,) + page)
             else:
                 cursor.execute('''
-                    SELECT * FROM feed_subscriptions
+                    SELECT id, enabled, feed_name, feed_url, feed_type, channel_name
+                    FROM feed_subscriptions
                     ORDER BY id
-                ''')
+                    LIMIT ? OFFSET ?
+                ''', page)
             
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            # sqlite3.Row already supports feed['column'] access, no dict copy needed
+            return cursor.fetchall()
+    
+    def _count_subscriptions(self, channel_filter: Optional[str] = None) -> int:
+        """Count subscriptions, optionally filtered by channel"""
+        with self.bot.db_manager.connection() as conn:
+            cursor = conn.cursor()
+            if channel_filter:
+                cursor.execute('SELECT COUNT(*) FROM feed_subscriptions WHERE channel_name = ?', (channel_filter,))
+            else:
+                cursor.execute('SELECT COUNT(*) FROM feed_subscriptions')
+            return cursor.fetchone()[0]
     
     def _get_subscription_by_id(self, feed_id: int) -> Optional[Dict]:
         """Get subscription by ID"""
-        import sqlite3
-        
         with self.bot.db_manager.connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute('SELECT * FROM feed_subscriptions WHERE id = ?', (feed_id,))
             row = cursor.fetchone()
@@ -384,8 +415,6 @@ feed status 1"""
     
     def _set_subscription_enabled(self, feed_id: int, enabled: bool) -> bool:
         """Enable or disable a subscription"""
-        import sqlite3
-        
         with self.bot.db_manager.connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
@@ -398,8 +427,6 @@ feed status 1"""
     
     def _update_subscription(self, feed_id: int, interval: Optional[int] = None) -> bool:
         """Update subscription settings"""
-        import sqlite3
-        
         with self.bot.db_manager.connection() as conn:
             cursor = conn.cursor()
             
@@ -7,8 +7,10 @@ Greets users on their first public channel message with mesh information
 import sqlite3
 import time
 import asyncio
+import logging
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, FrozenSet, Generator, List, Tuple
 from .base_command import BaseCommand
 from ..models import MeshMessage
 from ..utils import decode_escape_sequences
@@ -23,6 +25,12 @@ class GreeterCommand(BaseCommand):
     description = "Greets users on their first public channel message (once globally by default, or per-channel if configured)"
     category = "system"
     
+    GREETED_CACHE_TTL = 300  # seconds before the in-memory greeted set is reloaded from the database
+    CONTACT_COUNTS_TTL = 60  # seconds to reuse device contact counts for mesh info
+    ROLLOUT_CACHE_TTL = 30  # seconds to reuse the rollout-active answer in should_execute
+    SCHEMA_VERSION = 1  # bump to re-run the one-time greeted_users cleanup on next startup
+    SCHEMA_VERSION_KEY = 'greeter_schema_version'  # bot_metadata key holding the applied version
+    
     def __init__(self, bot: Any):
         """Initialize the greeter command.
         
@@ -30,6 +38,16 @@ class GreeterCommand(BaseCommand):
             bot: The bot instance.
         """
         super().__init__(bot)
+        # In-memory copy of greeted_users (sender_id, channel) pairs, loaded on first lookup
+        self._greeted_cache = set()
+        self._greeted_cache_expires = 0.0
+        # (expires_at, (total_contacts, repeaters, companions)) for mesh info greetings
+        self._contact_counts_cache: Optional[Tuple[float, Tuple[int, int, int]]] = None
+        self._message_stats_exists = False
+        # (expires_at, active) from the last _is_rollout_active database check
+        self._rollout_cache: Optional[Tuple[float, bool]] = None
+        # Lowercased monitor_channels, built on first use and dropped on config reload
+        self._monitor_channels_lower: Optional[FrozenSet[str]] = None
         self._init_greeter_tables()
         self._load_config()
         
@@ -51,59 +69,53 @@ class GreeterCommand(BaseCommand):
         # Auto-start rollout if enabled, rollout_days > 0, and no active rollout exists
         if self.enabled and self.rollout_days > 0:
             try:
-                with self.bot.db_manager.connection() as conn:
+                with self._write_connection() as conn:
                     cursor = conn.cursor()
-                    # Check for active rollout (more robust check)
+                    # Latest active and latest completed rollout, with end dates, in one pass
                     cursor.execute('''
-                        SELECT id, rollout_started_at, rollout_days, rollout_completed,
-                               datetime(rollout_started_at, '+' || rollout_days || ' days') as end_date,
-                               datetime('now') as current_time
-                        FROM greeter_rollout
-                        WHERE rollout_completed = 0
-                        ORDER BY rollout_started_at DESC
-                        LIMIT 1
+                        WITH active AS (
+                            SELECT id, datetime(rollout_started_at, '+' || rollout_days || ' days') AS end_date
+                            FROM greeter_rollout
+                            WHERE rollout_completed = 0
+                            ORDER BY rollout_started_at DESC
+                            LIMIT 1
+                        ), recent AS (
+                            SELECT id, datetime(rollout_started_at, '+' || rollout_days || ' days') AS end_date
+                            FROM greeter_rollout
+                            WHERE rollout_completed = 1
+                            ORDER BY rollout_started_at DESC
+                            LIMIT 1
+                        )
+                        SELECT (SELECT id FROM active), (SELECT end_date FROM active),
+                               (SELECT id FROM recent), (SELECT end_date FROM recent),
+                               datetime('now')
                     ''')
-                    active_rollout = cursor.fetchone()
+                    active_id, active_end_str, recent_id, recent_end_str, current_time_str = cursor.fetchone()
+                    current_time = datetime.fromisoformat(current_time_str)
                     
-                    if active_rollout:
+                    if active_id is not None:
                         # Verify the rollout is actually still active (not expired)
-                        rollout_id, started_at_str, rollout_days, completed, end_date_str, current_time_str = active_rollout
-                        end_date = datetime.fromisoformat(end_date_str)
-                        current_time = datetime.fromisoformat(current_time_str)
+                        end_date = datetime.fromisoformat(active_end_str)
                         
                         if current_time < end_date:
                             # Rollout is still active - don't start a new one
                             remaining = (end_date - current_time).total_seconds() / 86400
-                            self.logger.info(f"Active rollout found (ID: {rollout_id}, {remaining:.1f} days remaining) - not starting new rollout")
+                            self.logger.info(f"Active rollout found (ID: {active_id}, {remaining:.1f} days remaining) - not starting new rollout")
                         else:
                             # Rollout expired but not marked as completed - mark it and start new one
-                            self.logger.warning(f"Found expired rollout (ID: {rollout_id}) - marking as completed and starting new one")
+                            self.logger.warning(f"Found expired rollout (ID: {active_id}) - marking as completed and starting new one")
                             cursor.execute('''
                                 UPDATE greeter_rollout
                                 SET rollout_completed = 1
                                 WHERE id = ?
-                            ''', (rollout_id,))
+                            ''', (active_id,))
                             conn.commit()
                             self.logger.info(f"Auto-starting greeter rollout for {self.rollout_days} days")
                             self.start_rollout(backfill_first=self.auto_backfill)
                     else:
                         # No active rollout - check if one was recently completed to prevent immediate restart
-                        cursor.execute('''
-                            SELECT id, rollout_started_at, rollout_days
-                            FROM greeter_rollout
-                            WHERE rollout_completed = 1
-                            ORDER BY rollout_started_at DESC
-                            LIMIT 1
-                        ''')
-                        recent_rollout = cursor.fetchone()
-                        
-                        if recent_rollout:
-                            recent_id, recent_started_at_str, recent_rollout_days = recent_rollout
-                            recent_started_at = datetime.fromisoformat(recent_started_at_str)
-                            # Calculate when this rollout would have ended
-                            recent_end_date = recent_started_at + timedelta(days=recent_rollout_days)
-                            cursor.execute("SELECT datetime('now')")
-                            current_time = datetime.fromisoformat(cursor.fetchone()[0])
+                        if recent_id is not None:
+                            recent_end_date = datetime.fromisoformat(recent_end_str)
                             
                             # If rollout ended less than 1 day ago, don't auto-start a new one
                             # (prevents restart loops if there's a bug)
@@ -116,9 +128,7 @@ class GreeterCommand(BaseCommand):
                         self.logger.info(f"Auto-starting greeter rollout for {self.rollout_days} days")
                         self.start_rollout(backfill_first=self.auto_backfill)
             except Exception as e:
-                self.logger.error(f"Error checking for existing rollout: {e}")
-                import traceback
-                self.logger.error(traceback.format_exc())
+                self.logger.error(f"Error checking for existing rollout: {e}", exc_info=True)
     
     def _load_config(self) -> None:
         """Load configuration for greeter command."""
@@ -156,7 +166,7 @@ class GreeterCommand(BaseCommand):
         if channels_str:
             # Store both original and lowercase versions for case-insensitive matching
             self.greeter_channels = [ch.strip() for ch in channels_str.split(',') if ch.strip()]
-            self.greeter_channels_lower = [ch.lower() for ch in self.greeter_channels]
+            self.greeter_channels_lower = frozenset(ch.lower() for ch in self.greeter_channels)
         else:
             # Fall back to monitor_channels if not specified
             self.greeter_channels = None
@@ -179,15 +189,12 @@ class GreeterCommand(BaseCommand):
                     # Store both original and lowercase channel name for case-insensitive matching
                     self.channel_greetings[channel_name.lower()] = {
                         'channel': channel_name,
-                        'greeting': greeting
+                        'greeting': greeting,
+                        'parts': self._split_greeting_parts(greeting)
                     }
         
-        # Parse multi-part greetings (pipe-separated)
-        # If greeting_message contains '|', split it into multiple parts
-        if '|' in self.greeting_message:
-            self.greeting_parts = [part.strip() for part in self.greeting_message.split('|') if part.strip()]
-        else:
-            self.greeting_parts = [self.greeting_message]
+        # Parse multi-part greetings (pipe-separated) once, not per greeting
+        self.greeting_parts = self._split_greeting_parts(self.greeting_message)
         
         # Dead air delay settings
         self.dead_air_delay_seconds = self.get_config_value('Greeter_Command', 'dead_air_delay_seconds',
@@ -197,12 +204,40 @@ class GreeterCommand(BaseCommand):
         self.levenshtein_distance = self.get_config_value('Greeter_Command', 'levenshtein_distance',
                                                           fallback=0, value_type='int')
     
+    def on_config_reloaded(self) -> None:
+        """Drop the lowercased monitor_channels set so it is rebuilt from the reloaded list."""
+        self._monitor_channels_lower = None
+    
+    @staticmethod
+    def _split_greeting_parts(greeting: str) -> Tuple[str, ...]:
+        """Split a greeting template into its pipe-separated parts.
+        
+        The result is a tuple so the shared, config-derived templates cannot be
+        modified by a caller formatting a greeting.
+        
+        Args:
+            greeting: Greeting template, optionally containing '|' separators.
+            
+        Returns:
+            Tuple[str, ...]: Non-empty, stripped parts (the whole template if there is no '|').
+        """
+        if '|' in greeting:
+            return tuple(part.strip() for part in greeting.split('|') if part.strip())
+        return (greeting,)
+    
     def _init_greeter_tables(self) -> None:
         """Initialize database tables for greeter tracking."""
         try:
             with self.bot.db_manager.connection() as conn:
                 cursor = conn.cursor()
                 
+                # WAL is persistent for the database file, so switch once here
+                # instead of on every write
+                cursor.execute('PRAGMA journal_mode=WAL')
+                self._wal_enabled = str(cursor.fetchone()[0]).lower() == 'wal'
+                if self._wal_enabled:
+                    cursor.execute('PRAGMA synchronous=NORMAL')
+                
                 # Create greeted_users table for tracking who has been greeted
                 # channel can be NULL for global greetings (default behavior)
                 cursor.execute('''
@@ -222,6 +257,18 @@ class GreeterCommand(BaseCommand):
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_greeted_at ON greeted_users(greeted_at)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_greeted_sender_channel ON greeted_users(sender_id, channel)')
                 
+                # Covering partial index for the public-message scans in rollout marking,
+                # backfill and the 24h activity count (is_dm is listed so SQLite treats it
+                # as covering). message_stats is owned by the stats command and may not exist yet.
+                if self._has_message_stats(cursor):
+                    cursor.execute('''
+                        CREATE INDEX IF NOT EXISTS idx_msgstats_public_activity
+                        ON message_stats(timestamp, sender_id, channel, is_dm)
+                        WHERE is_dm = 0
+                    ''')
+                    # Superseded by idx_msgstats_public_activity
+                    cursor.execute('DROP INDEX IF EXISTS idx_msgstats_public_ts')
+                
                 # Create greeter_rollout table to track rollout period
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS greeter_rollout (
@@ -232,11 +279,20 @@ class GreeterCommand(BaseCommand):
                         active_users_marked INTEGER DEFAULT 0
                     )
                 ''')
+                # Serves the "latest rollout with rollout_completed = ?" lookups
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_rollout_active
+                    ON greeter_rollout(rollout_completed, rollout_started_at DESC)
+                ''')
                 
                 conn.commit()
                 
-                # Clean up any existing duplicates (in case they existed before UNIQUE constraint)
-                self._cleanup_duplicate_greetings()
+                # Clean up any existing duplicates (in case they existed before UNIQUE constraint).
+                # All greeter inserts are guarded against duplicates, so this runs once per
+                # SCHEMA_VERSION rather than scanning greeted_users on every startup.
+                if self._get_schema_version() < self.SCHEMA_VERSION:
+                    if self._cleanup_duplicate_greetings():
+                        self.bot.db_manager.set_metadata(self.SCHEMA_VERSION_KEY, str(self.SCHEMA_VERSION))
                 
                 self.logger.info("Greeter tables initialized successfully")
                 
@@ -244,18 +300,70 @@ class GreeterCommand(BaseCommand):
             self.logger.error(f"Failed to initialize greeter tables: {e}")
             raise
     
+    def _get_schema_version(self) -> int:
+        """Get the greeter schema version recorded in bot_metadata.
+        
+        Returns:
+            int: The stored version, or 0 if none has been recorded.
+        """
+        stored = self.bot.db_manager.get_metadata(self.SCHEMA_VERSION_KEY)
+        try:
+            return int(stored)
+        except (TypeError, ValueError):
+            return 0
+    
+    def _has_message_stats(self, cursor: sqlite3.Cursor) -> bool:
+        """Check whether the message_stats table exists.
+        
+        The table is created by the stats command and never dropped, so a
+        positive answer is cached; a negative one is re-checked next time in
+        case the table was created after the greeter started.
+        
+        Args:
+            cursor: Cursor on an open database connection.
+            
+        Returns:
+            bool: True if message_stats exists.
+        """
+        if not self._message_stats_exists:
+            cursor.execute('''
+                SELECT name FROM sqlite_master 
+                WHERE type='table' AND name='message_stats'
+            ''')
+            self._message_stats_exists = cursor.fetchone() is not None
+        return self._message_stats_exists
+    
+    @contextmanager
+    def _write_connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Open a database connection tuned for greeter writes.
+        
+        With WAL enabled, synchronous=NORMAL skips the fsync on every commit
+        while keeping the database consistent after a crash. temp_store=MEMORY
+        keeps the DISTINCT b-trees of the bulk rollout/backfill inserts off disk.
+        
+        Yields:
+            sqlite3.Connection: A connection from the bot's DB manager.
+        """
+        with self.bot.db_manager.connection() as conn:
+            if getattr(self, '_wal_enabled', False):
+                conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            yield conn
+    
     def _check_rollout_period(self) -> None:
         """Check if we're in a rollout period and mark active users if needed."""
         if not self.enabled:
             return
         
         try:
-            with self.bot.db_manager.connection() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Check if there's an active rollout
+                # Use SQLite's datetime functions to handle timezone correctly
                 cursor.execute('''
-                    SELECT id, rollout_started_at, rollout_days, rollout_completed
+                    SELECT id, datetime(rollout_started_at, '+' || rollout_days || ' days') as end_date,
+                           datetime('now') as current_time
                     FROM greeter_rollout
                     WHERE rollout_completed = 0
                     ORDER BY rollout_started_at DESC
@@ -265,37 +373,27 @@ class GreeterCommand(BaseCommand):
                 rollout = cursor.fetchone()
                 
                 if rollout:
-                    rollout_id, started_at_str, rollout_days, completed = rollout
-                    # Use SQLite's datetime functions to handle timezone correctly
-                    cursor.execute('''
-                        SELECT datetime(rollout_started_at, '+' || rollout_days || ' days') as end_date,
-                               datetime('now') as current_time
-                        FROM greeter_rollout
-                        WHERE id = ?
-                    ''', (rollout_id,))
-                    time_result = cursor.fetchone()
+                    rollout_id, end_date_str, current_time_str = rollout
+                    end_date = datetime.fromisoformat(end_date_str)
+                    current_time = datetime.fromisoformat(current_time_str)
+                    
+                    if current_time < end_date:
+                        # Still in rollout period - mark active users
+                        remaining = (end_date - current_time).total_seconds() / 86400
+                        self.logger.info(f"Greeter rollout active: marking active users (ends {end_date}, {remaining:.1f} days remaining)")
+                        self._mark_active_users_as_greeted(rollout_id)
+                    else:
+                        # Rollout period ended - mark as completed
+                        days_over = (current_time - end_date).total_seconds() / 86400
+                        cursor.execute('''
+                            UPDATE greeter_rollout
+                            SET rollout_completed = 1
+                            WHERE id = ?
+                        ''', (rollout_id,))
+                        conn.commit()
+                        self._rollout_cache = None
+                        self.logger.info(f"Greeter rollout period completed (ended {end_date}, {days_over:.1f} days ago) - will check for auto-restart")
                     
-                    if time_result:
-                        end_date_str, current_time_str = time_result
-                        end_date = datetime.fromisoformat(end_date_str)
-                        current_time = datetime.fromisoformat(current_time_str)
-                        
-                        if current_time < end_date:
-                            # Still in rollout period - mark active users
-                            remaining = (end_date - current_time).total_seconds() / 86400
-                            self.logger.info(f"Greeter rollout active: marking active users (ends {end_date}, {remaining:.1f} days remaining)")
-                            self._mark_active_users_as_greeted(rollout_id)
-                        else:
-                            # Rollout period ended - mark as completed
-                            days_over = (current_time - end_date).total_seconds() / 86400
-                            cursor.execute('''
-                                UPDATE greeter_rollout
-                                SET rollout_completed = 1
-                                WHERE id = ?
-                            ''', (rollout_id,))
-                            conn.commit()
-                            self.logger.info(f"Greeter rollout period completed (ended {end_date}, {days_over:.1f} days ago) - will check for auto-restart")
-                        
         except Exception as e:
             self.logger.error(f"Error checking rollout period: {e}")
     
@@ -306,7 +404,7 @@ class GreeterCommand(BaseCommand):
             rollout_id: The ID of the active rollout.
         """
         try:
-            with self.bot.db_manager.connection() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Get rollout start date
@@ -321,45 +419,28 @@ class GreeterCommand(BaseCommand):
                 
                 # Find all users who posted on public channels since rollout started
                 # Only get messages that are NOT DMs (is_dm = 0) and have a channel
-                cursor.execute('''
-                    SELECT DISTINCT sender_id, channel
-                    FROM message_stats
-                    WHERE is_dm = 0
-                      AND channel IS NOT NULL
-                      AND channel != ''
-                      AND timestamp >= ?
-                ''', (int(rollout_start.timestamp()),))
-                
-                active_users = cursor.fetchall()
-                marked_count = 0
-                
-                for sender_id, channel in active_users:
-                    # Mark based on per_channel_greetings setting
-                    # If per_channel_greetings is False, mark globally (channel = NULL)
-                    # If per_channel_greetings is True, mark per channel
-                    if self.per_channel_greetings:
-                        mark_channel = channel
-                        # Check if already greeted on this channel
-                        cursor.execute('''
-                            SELECT id FROM greeted_users
-                            WHERE sender_id = ? AND channel = ?
-                        ''', (sender_id, mark_channel))
-                    else:
-                        mark_channel = None
-                        # Check if already greeted globally
-                        cursor.execute('''
-                            SELECT id FROM greeted_users
-                            WHERE sender_id = ? AND channel IS NULL
-                        ''', (sender_id,))
-                    
-                    if not cursor.fetchone():
-                        # Mark as greeted with rollout flag
-                        cursor.execute('''
-                            INSERT OR IGNORE INTO greeted_users
-                            (sender_id, channel, rollout_marked, greeted_at)
-                            VALUES (?, ?, 1, ?)
-                        ''', (sender_id, mark_channel, rollout_start.isoformat()))
-                        marked_count += 1
+                # Mark based on per_channel_greetings setting
+                # If per_channel_greetings is False, mark globally (channel = NULL), one row per sender
+                # If per_channel_greetings is True, mark per channel
+                # UNIQUE(sender_id, channel) does not dedupe NULL channels, so the
+                # existence check lives in the INSERT itself (channel IS matches NULL)
+                channel_expr = 'm.channel' if self.per_channel_greetings else 'NULL'
+                cursor.execute(f'''
+                    INSERT OR IGNORE INTO greeted_users
+                    (sender_id, channel, rollout_marked, greeted_at)
+                    SELECT DISTINCT m.sender_id, {channel_expr}, 1, ?
+                    FROM message_stats m
+                    WHERE m.is_dm = 0
+                      AND m.channel IS NOT NULL
+                      AND m.channel != ''
+                      AND m.timestamp >= ?
+                      AND NOT EXISTS (
+                          SELECT 1 FROM greeted_users g
+                          WHERE g.sender_id = m.sender_id AND g.channel IS {channel_expr}
+                      )
+                ''', (rollout_start.isoformat(), int(rollout_start.timestamp())))
+                marked_count = cursor.rowcount
+                self._greeted_cache_expires = 0.0
                 
                 # Update rollout record
                 cursor.execute('''
@@ -393,73 +474,50 @@ class GreeterCommand(BaseCommand):
             return {'success': False, 'error': 'Greeter is disabled'}
         
         try:
-            with self.bot.db_manager.connection() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Check if message_stats table exists
-                cursor.execute('''
-                    SELECT name FROM sqlite_master 
-                    WHERE type='table' AND name='message_stats'
-                ''')
-                if not cursor.fetchone():
+                if not self._has_message_stats(cursor):
                     return {
                         'success': False,
                         'error': 'message_stats table does not exist',
                         'marked_count': 0
                     }
                 
-                # Build query to find all users who posted on public channels
-                if lookback_days:
-                    cutoff_timestamp = int(time.time()) - (lookback_days * 24 * 60 * 60)
-                    cursor.execute('''
-                        SELECT DISTINCT sender_id, channel
-                        FROM message_stats
-                        WHERE is_dm = 0
-                          AND channel IS NOT NULL
-                          AND channel != ''
-                          AND timestamp >= ?
-                    ''', (cutoff_timestamp,))
-                else:
-                    # All time
-                    cursor.execute('''
-                        SELECT DISTINCT sender_id, channel
-                        FROM message_stats
-                        WHERE is_dm = 0
-                          AND channel IS NOT NULL
-                          AND channel != ''
-                    ''')
+                # Mark based on per_channel_greetings setting: one row per channel,
+                # or one global row (channel = NULL) per sender
+                channel_expr = 'm.channel' if self.per_channel_greetings else 'NULL'
+                cutoff_timestamp = int(time.time()) - (lookback_days * 24 * 60 * 60) if lookback_days else 0
+                public_messages = '''
+                    FROM message_stats m
+                    WHERE m.is_dm = 0
+                      AND m.channel IS NOT NULL
+                      AND m.channel != ''
+                      AND m.timestamp >= ?
+                '''
                 
-                historical_users = cursor.fetchall()
-                marked_count = 0
-                skipped_count = 0
+                cursor.execute(f'''
+                    SELECT COUNT(*) FROM (SELECT DISTINCT m.sender_id, {channel_expr} {public_messages})
+                ''', (cutoff_timestamp,))
+                total_users_found = cursor.fetchone()[0]
                 
-                for sender_id, channel in historical_users:
-                    # Mark based on per_channel_greetings setting
-                    if self.per_channel_greetings:
-                        mark_channel = channel
-                        # Check if already greeted on this channel
-                        cursor.execute('''
-                            SELECT id FROM greeted_users
-                            WHERE sender_id = ? AND channel = ?
-                        ''', (sender_id, mark_channel))
-                    else:
-                        mark_channel = None
-                        # Check if already greeted globally
-                        cursor.execute('''
-                            SELECT id FROM greeted_users
-                            WHERE sender_id = ? AND channel IS NULL
-                        ''', (sender_id,))
-                    
-                    if not cursor.fetchone():
-                        # Mark as greeted with backfill flag (use current time as greeted_at)
-                        cursor.execute('''
-                            INSERT OR IGNORE INTO greeted_users
-                            (sender_id, channel, rollout_marked, greeted_at)
-                            VALUES (?, ?, 1, datetime('now'))
-                        ''', (sender_id, mark_channel))
-                        marked_count += 1
-                    else:
-                        skipped_count += 1
+                # Mark as greeted with backfill flag (use current time as greeted_at).
+                # NOT EXISTS rather than the UNIQUE constraint skips existing global
+                # rows, since UNIQUE(sender_id, channel) treats NULL channels as distinct.
+                cursor.execute(f'''
+                    INSERT OR IGNORE INTO greeted_users
+                    (sender_id, channel, rollout_marked, greeted_at)
+                    SELECT DISTINCT m.sender_id, {channel_expr}, 1, datetime('now')
+                    {public_messages}
+                      AND NOT EXISTS (
+                          SELECT 1 FROM greeted_users g
+                          WHERE g.sender_id = m.sender_id AND g.channel IS {channel_expr}
+                      )
+                ''', (cutoff_timestamp,))
+                marked_count = cursor.rowcount
+                skipped_count = total_users_found - marked_count
+                self._greeted_cache_expires = 0.0
                 
                 conn.commit()
                 
@@ -467,12 +525,12 @@ class GreeterCommand(BaseCommand):
                     'success': True,
                     'marked_count': marked_count,
                     'skipped_count': skipped_count,
-                    'total_users_found': len(historical_users),
+                    'total_users_found': total_users_found,
                     'lookback_days': lookback_days
                 }
                 
                 self.logger.info(f"Backfilled {marked_count} users from historical message_stats data "
-                               f"({skipped_count} already marked, {len(historical_users)} total found)")
+                               f"({skipped_count} already marked, {total_users_found} total found)")
                 
                 return result
                 
@@ -508,7 +566,7 @@ class GreeterCommand(BaseCommand):
             
             rollout_days = days or self.rollout_days
             
-            with self.bot.db_manager.connection() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Check if there's already an active rollout
@@ -529,6 +587,7 @@ class GreeterCommand(BaseCommand):
                 
                 rollout_id = cursor.lastrowid
                 conn.commit()
+                self._rollout_cache = None
                 
                 # Mark active users immediately
                 self._mark_active_users_as_greeted(rollout_id)
@@ -540,23 +599,29 @@ class GreeterCommand(BaseCommand):
             self.logger.error(f"Error starting rollout: {e}")
             return False
     
-    def _levenshtein_distance(self, s1: str, s2: str) -> int:
+    def _levenshtein_distance(self, s1: str, s2: str, max_distance: Optional[int] = None) -> int:
         """Calculate Levenshtein distance between two strings.
         
         Args:
             s1: First string.
             s2: Second string.
+            max_distance: Optional cutoff. Once the distance is known to exceed
+                it, max_distance + 1 is returned without finishing the table.
             
         Returns:
-            int: Levenshtein distance (number of edits needed).
+            int: Levenshtein distance (number of edits needed), or
+            max_distance + 1 if the cutoff was exceeded.
         """
         if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
+            s1, s2 = s2, s1
+        
+        if max_distance is not None and len(s1) - len(s2) > max_distance:
+            return max_distance + 1
         
         if len(s2) == 0:
             return len(s1)
         
-        previous_row = range(len(s2) + 1)
+        previous_row = list(range(len(s2) + 1))
         for i, c1 in enumerate(s1):
             current_row = [i + 1]
             for j, c2 in enumerate(s2):
@@ -564,6 +629,9 @@ class GreeterCommand(BaseCommand):
                 deletions = current_row[j] + 1
                 substitutions = previous_row[j] + (c1 != c2)
                 current_row.append(min(insertions, deletions, substitutions))
+            # Row minimums never decrease, so stop once every cell is past the cutoff
+            if max_distance is not None and min(current_row) > max_distance:
+                return max_distance + 1
             previous_row = current_row
         
         return previous_row[-1]
@@ -585,24 +653,31 @@ class GreeterCommand(BaseCommand):
             with self.bot.db_manager.connection() as conn:
                 cursor = conn.cursor()
                 
+                # Edit distance is at least the length difference, so only names within
+                # levenshtein_distance characters of this one's length can match
+                min_length = len(sender_id) - self.levenshtein_distance
+                max_length = len(sender_id) + self.levenshtein_distance
+                
                 if self.per_channel_greetings:
                     # Per-channel mode: check greeted users on this specific channel
                     cursor.execute('''
                         SELECT DISTINCT sender_id FROM greeted_users
-                        WHERE channel = ?
-                    ''', (channel,))
+                        WHERE channel = ? AND length(sender_id) BETWEEN ? AND ?
+                    ''', (channel, min_length, max_length))
                 else:
                     # Global mode: check all greeted users (channel = NULL)
                     cursor.execute('''
                         SELECT DISTINCT sender_id FROM greeted_users
-                        WHERE channel IS NULL
-                    ''')
+                        WHERE channel IS NULL AND length(sender_id) BETWEEN ? AND ?
+                    ''', (min_length, max_length))
                 
                 greeted_users = cursor.fetchall()
                 
                 # Check each greeted user for similarity
+                sender_lower = sender_id.lower()
                 for (greeted_id,) in greeted_users:
-                    distance = self._levenshtein_distance(sender_id.lower(), greeted_id.lower())
+                    distance = self._levenshtein_distance(sender_lower, greeted_id.lower(),
+                                                         self.levenshtein_distance)
                     if distance <= self.levenshtein_distance:
                         self.logger.debug(f"Found similar user: {greeted_id} (distance: {distance} from {sender_id})")
                         return greeted_id
@@ -612,9 +687,33 @@ class GreeterCommand(BaseCommand):
             self.logger.error(f"Error checking for similar greeted users: {e}")
             return None
     
+    def _greeted_key(self, sender_id: str, channel: Optional[str]) -> Tuple[str, Optional[str]]:
+        """Build the greeted_users key for a user under the current greeting mode.
+        
+        Args:
+            sender_id: The user's ID.
+            channel: The channel name (used only if per_channel_greetings is True).
+            
+        Returns:
+            Tuple[str, Optional[str]]: (sender_id, channel), with channel None in global mode.
+        """
+        return (sender_id, channel if self.per_channel_greetings else None)
+    
+    def _load_greeted_cache(self) -> None:
+        """Reload the in-memory greeted set from the greeted_users table."""
+        with self.bot.db_manager.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT sender_id, channel FROM greeted_users')
+            self._greeted_cache = {(sender_id, channel) for sender_id, channel in cursor.fetchall()}
+        self._greeted_cache_expires = time.monotonic() + self.GREETED_CACHE_TTL
+    
     def has_been_greeted(self, sender_id: str, channel: str) -> bool:
         """Check if a user has been greeted.
         
+        Answers from the in-memory greeted set when possible; it is reloaded every
+        GREETED_CACHE_TTL seconds so rows removed elsewhere (e.g. the web viewer)
+        are picked up. A miss is confirmed against the database.
+        
         Args:
             sender_id: The user's ID.
             channel: The channel name (used only if per_channel_greetings is True).
@@ -623,23 +722,23 @@ class GreeterCommand(BaseCommand):
             bool: True if user has been greeted (globally or on this channel), False otherwise.
         """
         try:
+            key = self._greeted_key(sender_id, channel)
+            if time.monotonic() >= self._greeted_cache_expires:
+                self._load_greeted_cache()
+            if key in self._greeted_cache:
+                return True
+            
             with self.bot.db_manager.connection() as conn:
                 cursor = conn.cursor()
                 
-                if self.per_channel_greetings:
-                    # Per-channel mode: check if greeted on this specific channel
-                    cursor.execute('''
-                        SELECT id FROM greeted_users
-                        WHERE sender_id = ? AND channel = ?
-                    ''', (sender_id, channel))
-                else:
-                    # Global mode: check if greeted at all (channel = NULL)
-                    cursor.execute('''
-                        SELECT id FROM greeted_users
-                        WHERE sender_id = ? AND channel IS NULL
-                    ''', (sender_id,))
+                # Check if greeted on this channel (per-channel mode) or at all (global mode, channel = NULL)
+                cursor.execute('''
+                    SELECT id FROM greeted_users
+                    WHERE sender_id = ? AND channel IS ?
+                ''', key)
                 
                 if cursor.fetchone() is not None:
+                    self._greeted_cache.add(key)
                     return True
                 
                 # If exact match not found and Levenshtein distance is enabled, check for similar names
@@ -657,8 +756,6 @@ class GreeterCommand(BaseCommand):
     def mark_as_greeted(self, sender_id: str, channel: str) -> bool:
         """Mark a user as greeted atomically.
         
-        Uses INSERT OR IGNORE with UNIQUE constraint to handle race conditions.
-        
         Args:
             sender_id: The user's ID.
             channel: The channel name (stored only if per_channel_greetings is True).
@@ -666,153 +763,81 @@ class GreeterCommand(BaseCommand):
         Returns:
             bool: True if user was marked (or already marked), False on error.
         """
+        return self._insert_greeted(sender_id, channel) is not None
+    
+    def _insert_greeted(self, sender_id: str, channel: str) -> Optional[bool]:
+        """Insert the greeted_users row for a user unless one already exists.
+        
+        A single INSERT guarded by NOT EXISTS handles race conditions. The
+        UNIQUE(sender_id, channel) constraint alone is not enough because SQLite
+        treats NULL channels (global mode) as distinct.
+        
+        Args:
+            sender_id: The user's ID.
+            channel: The channel name (stored only if per_channel_greetings is True).
+            
+        Returns:
+            Optional[bool]: True if this call inserted the row, False if the user was
+            already marked, None on error.
+        """
         try:
             self.logger.debug(f"Marking {sender_id} as greeted (channel: {channel})")
+            key = self._greeted_key(sender_id, channel)
             
-            with self.bot.db_manager.connection() as conn:
-                # Use WAL mode for better concurrency (if not already enabled)
-                # This helps with race conditions
-                conn.execute('PRAGMA journal_mode=WAL')
-                
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
-                
-                # Check if user is already greeted first to avoid unnecessary inserts
-                # This also helps us detect and handle any existing duplicates
+                # Global mode stores NULL for channel (greeted once globally)
+                cursor.execute('''
+                    INSERT OR IGNORE INTO greeted_users (sender_id, channel)
+                    SELECT ?, ?
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM greeted_users WHERE sender_id = ? AND channel IS ?
+                    )
+                ''', key + key)
+                conn.commit()
+                inserted = cursor.rowcount == 1
+            
+            self._greeted_cache.add(key)
+            if inserted:
                 if self.per_channel_greetings:
-                    cursor.execute('''
-                        SELECT id, greeted_at FROM greeted_users
-                        WHERE sender_id = ? AND channel = ?
-                        ORDER BY greeted_at ASC
-                        LIMIT 1
-                    ''', (sender_id, channel))
-                    existing = cursor.fetchone()
-                    
-                    if existing:
-                        # User already greeted - check if there are duplicates
-                        cursor.execute('''
-                            SELECT COUNT(*) FROM greeted_users
-                            WHERE sender_id = ? AND channel = ?
-                        ''', (sender_id, channel))
-                        count = cursor.fetchone()[0]
-                        if count > 1:
-                            # Duplicates exist - clean them up, keeping the earliest (first) greeting
-                            cursor.execute('''
-                                SELECT id FROM greeted_users
-                                WHERE sender_id = ? AND channel = ?
-                                ORDER BY greeted_at ASC
-                            ''', (sender_id, channel))
-                            all_ids = [row[0] for row in cursor.fetchall()]
-                            if len(all_ids) > 1:
-                                # Delete all but the first (earliest)
-                                placeholders = ','.join(['?'] * (len(all_ids) - 1))
-                                cursor.execute(f'''
-                                    DELETE FROM greeted_users
-                                    WHERE id IN ({placeholders})
-                                ''', all_ids[1:])
-                                conn.commit()
-                                self.logger.debug(f"Cleaned up {len(all_ids) - 1} duplicate greeting entries for {sender_id} on {channel}, kept earliest")
-                        self.logger.debug(f"User {sender_id} already greeted on channel {channel}")
-                        return True
-                    
-                    # User not greeted yet - insert
-                    try:
-                        cursor.execute('''
-                            INSERT INTO greeted_users (sender_id, channel)
-                            VALUES (?, ?)
-                        ''', (sender_id, channel))
-                        conn.commit()
-                        self.logger.info(f"✅ Saved: Marked {sender_id} as greeted on channel {channel}")
-                        return True
-                    except sqlite3.IntegrityError:
-                        # Race condition - another process inserted it between our check and insert
-                        # This is fine, the user is now greeted
-                        conn.rollback()
-                        self.logger.debug(f"User {sender_id} was marked as greeted by another process (race condition)")
-                        return True
+                    self.logger.info(f"✅ Saved: Marked {sender_id} as greeted on channel {channel}")
                 else:
-                    # Global mode: store NULL for channel (greeted once globally)
-                    cursor.execute('''
-                        SELECT id, greeted_at FROM greeted_users
-                        WHERE sender_id = ? AND channel IS NULL
-                        ORDER BY greeted_at ASC
-                        LIMIT 1
-                    ''', (sender_id,))
-                    existing = cursor.fetchone()
-                    
-                    if existing:
-                        # User already greeted - check if there are duplicates
-                        cursor.execute('''
-                            SELECT COUNT(*) FROM greeted_users
-                            WHERE sender_id = ? AND channel IS NULL
-                        ''', (sender_id,))
-                        count = cursor.fetchone()[0]
-                        if count > 1:
-                            # Duplicates exist - clean them up, keeping the earliest (first) greeting
-                            cursor.execute('''
-                                SELECT id FROM greeted_users
-                                WHERE sender_id = ? AND channel IS NULL
-                                ORDER BY greeted_at ASC
-                            ''', (sender_id,))
-                            all_ids = [row[0] for row in cursor.fetchall()]
-                            if len(all_ids) > 1:
-                                # Delete all but the first (earliest)
-                                placeholders = ','.join(['?'] * (len(all_ids) - 1))
-                                cursor.execute(f'''
-                                    DELETE FROM greeted_users
-                                    WHERE id IN ({placeholders})
-                                ''', all_ids[1:])
-                                conn.commit()
-                                self.logger.debug(f"Cleaned up {len(all_ids) - 1} duplicate greeting entries for {sender_id} (global), kept earliest")
-                        self.logger.debug(f"User {sender_id} already greeted globally")
-                        return True
-                    
-                    # User not greeted yet - insert
-                    try:
-                        cursor.execute('''
-                            INSERT INTO greeted_users (sender_id, channel)
-                            VALUES (?, NULL)
-                        ''', (sender_id,))
-                        conn.commit()
-                        self.logger.info(f"✅ Saved: Marked {sender_id} as greeted globally (all channels)")
-                        return True
-                    except sqlite3.IntegrityError:
-                        # Race condition - another process inserted it between our check and insert
-                        # This is fine, the user is now greeted
-                        conn.rollback()
-                        self.logger.debug(f"User {sender_id} was marked as greeted by another process (race condition)")
-                        return True
+                    self.logger.info(f"✅ Saved: Marked {sender_id} as greeted globally (all channels)")
+            elif self.per_channel_greetings:
+                self.logger.debug(f"User {sender_id} already greeted on channel {channel}")
+            else:
+                self.logger.debug(f"User {sender_id} already greeted globally")
+            return inserted
                         
-        except sqlite3.IntegrityError as e:
-            # UNIQUE constraint violation - should not happen with INSERT OR IGNORE
-            # but handle it gracefully if it does (means user already marked)
-            self.logger.debug(f"User {sender_id} already marked as greeted (integrity check: {e})")
-            return True
         except Exception as e:
-            self.logger.error(f"❌ Error marking user as greeted: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
-            return False
+            self.logger.error(f"❌ Error marking user as greeted: {e}", exc_info=True)
+            return None
     
     def get_greeted_users_count(self) -> int:
         """Get count of users who have been greeted.
         
+        Counted from the in-memory greeted set, which mirrors greeted_users
+        (reloaded every GREETED_CACHE_TTL seconds), rather than a COUNT(*) scan.
+        
         Returns:
             int: The total count of greeted users.
         """
         try:
-            with self.bot.db_manager.connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('SELECT COUNT(*) FROM greeted_users')
-                count = cursor.fetchone()[0]
-                return count
+            if time.monotonic() >= self._greeted_cache_expires:
+                self._load_greeted_cache()
+            return len(self._greeted_cache)
         except Exception as e:
             self.logger.error(f"Error getting greeted users count: {e}")
             return 0
     
-    def _cleanup_duplicate_greetings(self) -> None:
-        """Remove duplicate entries from greeted_users table."""
+    def _cleanup_duplicate_greetings(self) -> bool:
+        """Remove duplicate entries from greeted_users table.
+        
+        Returns:
+            bool: True if the cleanup completed, False on error.
+        """
         try:
-            with self.bot.db_manager.connection() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Find duplicates - count how many exist per (sender_id, channel)
@@ -864,10 +889,12 @@ class GreeterCommand(BaseCommand):
                     self.logger.info(f"Cleaned up duplicate greeting entries")
                 else:
                     self.logger.debug("No duplicate greeting entries found")
+                return True
                     
         except Exception as e:
             self.logger.error(f"Error cleaning up duplicate greetings: {e}")
             # Don't raise - allow initialization to continue even if cleanup fails
+            return False
     
     def get_recent_greeted_users(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent greeted users.
@@ -895,6 +922,32 @@ class GreeterCommand(BaseCommand):
             self.logger.error(f"Error getting recent greeted users: {e}")
             return []
     
+    def _get_contact_counts(self) -> Tuple[int, int, int]:
+        """Count device contacts by role, reusing the result for CONTACT_COUNTS_TTL seconds.
+        
+        Returns:
+            Tuple[int, int, int]: (total_contacts, repeaters, companions).
+        """
+        now = time.monotonic()
+        if self._contact_counts_cache and now < self._contact_counts_cache[0]:
+            return self._contact_counts_cache[1]
+        
+        contacts = self.bot.meshcore.contacts
+        repeaters = 0
+        companions = 0
+        # Count repeaters and companions
+        if hasattr(self.bot, 'repeater_manager'):
+            is_repeater = self.bot.repeater_manager._is_repeater_device
+            for contact_data in contacts.values():
+                if is_repeater(contact_data):
+                    repeaters += 1
+                else:
+                    companions += 1
+        
+        counts = (len(contacts), repeaters, companions)
+        self._contact_counts_cache = (now + self.CONTACT_COUNTS_TTL, counts)
+        return counts
+    
     async def _get_mesh_info(self) -> Dict[str, Any]:
         """Get mesh network information for greeting.
         
@@ -923,15 +976,7 @@ class GreeterCommand(BaseCommand):
             
             # Fallback to device contacts if repeater manager stats not available
             if info['total_contacts'] == 0 and hasattr(self.bot, 'meshcore') and hasattr(self.bot.meshcore, 'contacts'):
-                info['total_contacts'] = len(self.bot.meshcore.contacts)
-                
-                # Count repeaters and companions
-                if hasattr(self.bot, 'repeater_manager'):
-                    for contact_data in self.bot.meshcore.contacts.values():
-                        if self.bot.repeater_manager._is_repeater_device(contact_data):
-                            info['repeaters'] += 1
-                        else:
-                            info['companions'] += 1
+                info['total_contacts'], info['repeaters'], info['companions'] = self._get_contact_counts()
             
             # Get recent activity from message_stats if available
             if info['recent_activity_24h'] == 0:
@@ -939,11 +984,7 @@ class GreeterCommand(BaseCommand):
                     with self.bot.db_manager.connection() as conn:
                         cursor = conn.cursor()
                         # Check if message_stats table exists
-                        cursor.execute('''
-                            SELECT name FROM sqlite_master 
-                            WHERE type='table' AND name='message_stats'
-                        ''')
-                        if cursor.fetchone():
+                        if self._has_message_stats(cursor):
                             cutoff_time = int(time.time()) - (24 * 60 * 60)
                             cursor.execute('''
                                 SELECT COUNT(DISTINCT sender_id)
@@ -970,9 +1011,8 @@ class GreeterCommand(BaseCommand):
         Returns:
             str: Greeting message template for the channel, or default if not specified.
         """
-        if channel and channel.lower() in self.channel_greetings:
-            return self.channel_greetings[channel.lower()]['greeting']
-        return self.greeting_message
+        channel_greeting = self.channel_greetings.get(channel.lower()) if channel else None
+        return channel_greeting['greeting'] if channel_greeting else self.greeting_message
     
     async def _format_greeting_parts(self, sender_id: str, channel: Optional[str] = None, mesh_info: Optional[Dict[str, Any]] = None) -> List[str]:
         """Format greeting message parts with mesh information.
@@ -985,17 +1025,14 @@ class GreeterCommand(BaseCommand):
         Returns:
             List[str]: List of greeting message strings (for multi-part greetings).
         """
-        if mesh_info is None:
+        # Mesh info is only fetched when it will be appended to the greeting
+        if self.include_mesh_info and mesh_info is None:
             mesh_info = await self._get_mesh_info()
         
-        # Get channel-specific greeting if available, otherwise use default
-        greeting_template = self._get_greeting_for_channel(channel) if channel else self.greeting_message
-        
-        # Parse multi-part greetings (pipe-separated)
-        if '|' in greeting_template:
-            greeting_parts = [part.strip() for part in greeting_template.split('|') if part.strip()]
-        else:
-            greeting_parts = [greeting_template]
+        # Get channel-specific greeting parts if available, otherwise use default
+        # (both were split into parts when the config was loaded)
+        channel_greeting = self.channel_greetings.get(channel.lower()) if channel else None
+        greeting_parts = channel_greeting['parts'] if channel_greeting else self.greeting_parts
         
         # Format each greeting part
         formatted_parts = []
@@ -1005,7 +1042,8 @@ class GreeterCommand(BaseCommand):
         
         # Add mesh info to the last part if enabled
         if self.include_mesh_info:
-            self.logger.debug(f"Including mesh info. Format: {repr(self.mesh_info_format)}, Mesh info: {mesh_info}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Including mesh info. Format: {repr(self.mesh_info_format)}, Mesh info: {mesh_info}")
             try:
                 mesh_info_text = self.mesh_info_format.format(
                     total_contacts=mesh_info.get('total_contacts', 0),
@@ -1013,7 +1051,8 @@ class GreeterCommand(BaseCommand):
                     companions=mesh_info.get('companions', 0),
                     recent_activity_24h=mesh_info.get('recent_activity_24h', 0)
                 )
-                self.logger.debug(f"Formatted mesh info text: {repr(mesh_info_text)}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Formatted mesh info text: {repr(mesh_info_text)}")
                 # Append mesh info to the last greeting part
                 if formatted_parts:
                     formatted_parts[-1] += mesh_info_text
@@ -1055,18 +1094,25 @@ class GreeterCommand(BaseCommand):
     def _is_rollout_active(self) -> bool:
         """Check if there's an active rollout period.
         
+        The answer is cached for up to ROLLOUT_CACHE_TTL seconds (and never past
+        the rollout's end), since should_execute asks for every public message.
+        
         Returns:
             bool: True if a rollout is active, False otherwise.
         """
+        now = time.monotonic()
+        if self._rollout_cache and now < self._rollout_cache[0]:
+            return self._rollout_cache[1]
+        
         try:
             with self.bot.db_manager.connection() as conn:
                 cursor = conn.cursor()
-                # Use SQLite's datetime functions to calculate end date and compare with current time
+                # Use SQLite's date functions to calculate the days remaining until the end date
                 # This handles timezone issues automatically since both are in UTC
                 cursor.execute('''
-                    SELECT id, rollout_started_at, rollout_days,
+                    SELECT id, rollout_started_at,
                            datetime(rollout_started_at, '+' || rollout_days || ' days') as end_date,
-                           datetime('now') as current_time
+                           julianday(rollout_started_at, '+' || rollout_days || ' days') - julianday('now') as days_remaining
                     FROM greeter_rollout
                     WHERE rollout_completed = 0
                     ORDER BY rollout_started_at DESC
@@ -1075,20 +1121,15 @@ class GreeterCommand(BaseCommand):
                 rollout = cursor.fetchone()
                 
                 if rollout:
-                    rollout_id, started_at_str, rollout_days, end_date_str, current_time_str = rollout
-                    
-                    # Parse for logging (both are in UTC from SQLite)
-                    started_at = datetime.fromisoformat(started_at_str)
-                    end_date = datetime.fromisoformat(end_date_str)
-                    current_time = datetime.fromisoformat(current_time_str)
+                    rollout_id, started_at, end_date, remaining = rollout
                     
-                    if current_time < end_date:
-                        remaining = (end_date - current_time).total_seconds() / 86400  # days
+                    if remaining > 0:
                         self.logger.debug(f"Rollout active: {remaining:.1f} days remaining (started {started_at}, ends {end_date})")
+                        self._rollout_cache = (now + min(self.ROLLOUT_CACHE_TTL, remaining * 86400), True)
                         return True
                     else:
                         # Rollout period ended - mark as completed
-                        days_over = (current_time - end_date).total_seconds() / 86400
+                        days_over = -remaining
                         cursor.execute('''
                             UPDATE greeter_rollout
                             SET rollout_completed = 1
@@ -1096,14 +1137,14 @@ class GreeterCommand(BaseCommand):
                         ''', (rollout_id,))
                         conn.commit()
                         self.logger.info(f"Greeter rollout period completed (ended {end_date}, {days_over:.1f} days ago)")
+                        self._rollout_cache = (now + self.ROLLOUT_CACHE_TTL, False)
                         return False
                 
                 self.logger.debug("No active rollout found")
+                self._rollout_cache = (now + self.ROLLOUT_CACHE_TTL, False)
                 return False
         except Exception as e:
-            self.logger.error(f"Error checking rollout status: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.error(f"Error checking rollout status: {e}", exc_info=True)
             return False
     
     def _check_human_greeting(self, new_user_id: str, channel: str, since_timestamp: int) -> bool:
@@ -1125,11 +1166,7 @@ class GreeterCommand(BaseCommand):
                 cursor = conn.cursor()
                 
                 # Check if message_stats table exists
-                cursor.execute('''
-                    SELECT name FROM sqlite_master 
-                    WHERE type='table' AND name='message_stats'
-                ''')
-                if not cursor.fetchone():
+                if not self._has_message_stats(cursor):
                     return False
                 
                 # Get recent messages from this channel since the new user posted
@@ -1156,7 +1193,7 @@ class GreeterCommand(BaseCommand):
                             for word in words:
                                 # Remove common punctuation
                                 word = word.strip('.,!?;:()[]{}@')
-                                distance = self._levenshtein_distance(new_user_id_lower, word)
+                                distance = self._levenshtein_distance(new_user_id_lower, word, self.levenshtein_distance)
                                 if distance <= self.levenshtein_distance:
                                     self.logger.info(f"Human greeting detected: {sender_id} mentioned {new_user_id} in channel {channel}")
                                     return True
@@ -1258,9 +1295,10 @@ class GreeterCommand(BaseCommand):
             mode_str = "per-channel" if self.per_channel_greetings else "global"
             self.logger.info(f"Greeting {message.sender_id} on channel {message.channel} ({mode_str} mode, {len(greeting_parts)} part(s))")
             
-            # Log database verification
-            total_greeted = self.get_greeted_users_count()
-            self.logger.debug(f"Database verification: {total_greeted} total user(s) marked as greeted")
+            # Log database verification (the count is only needed for the debug log)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                total_greeted = self.get_greeted_users_count()
+                self.logger.debug(f"Database verification: {total_greeted} total user(s) marked as greeted")
             
             # Send all greeting parts (rate-limit spacing handled by send_response_chunked)
             success = await self.send_response_chunked(message, greeting_parts)
@@ -1295,39 +1333,40 @@ class GreeterCommand(BaseCommand):
         # First try standardized method (case-sensitive)
         if not self.is_channel_allowed(message):
             # If standardized check fails, try case-insensitive matching for backward compatibility
+            channel_lower = message.channel.lower()
             if self.greeter_channels is not None:
                 # Use greeter-specific channels if configured (case-insensitive matching)
-                if message.channel and message.channel.lower() not in self.greeter_channels_lower:
+                if channel_lower not in self.greeter_channels_lower:
                     return False
             else:
                 # Fall back to general monitor_channels setting (case-insensitive matching)
-                monitor_channels_lower = [ch.lower() for ch in self.bot.command_manager.monitor_channels]
-                if message.channel and message.channel.lower() not in monitor_channels_lower:
+                if self._monitor_channels_lower is None:
+                    self._monitor_channels_lower = frozenset(ch.lower() for ch in self.bot.command_manager.monitor_channels)
+                if channel_lower not in self._monitor_channels_lower:
                     return False
         
+        # Check if user has already been greeted (globally or per-channel, depending on config)
+        # This is the common case for busy channels, so it runs before the rollout check
+        if self.has_been_greeted(message.sender_id, message.channel):
+            return False
+        
         # Check if we're in an active rollout period
         rollout_active = self._is_rollout_active()
         if rollout_active:
             # During rollout, mark user as greeted but don't actually greet them
-            # Check if already greeted first to avoid misleading logs
-            if not self.has_been_greeted(message.sender_id, message.channel):
-                self.logger.info(f"🔄 Rollout active: Marking {message.sender_id} as greeted on {message.channel} (no greeting sent)")
-            else:
-                self.logger.debug(f"🔄 Rollout active: {message.sender_id} already greeted on {message.channel} (skipping)")
+            self.logger.info(f"🔄 Rollout active: Marking {message.sender_id} as greeted on {message.channel} (no greeting sent)")
             self.mark_as_greeted(message.sender_id, message.channel)
             return False
         else:
             self.logger.debug(f"Rollout not active - proceeding with greeting check for {message.sender_id}")
         
-        # Check if user has already been greeted (globally or per-channel, depending on config)
-        if self.has_been_greeted(message.sender_id, message.channel):
-            return False
-        
         return True
     
     async def execute(self, message: MeshMessage) -> bool:
         """Execute the greeter command.
         
+        Called by the message handler after should_execute() has returned True.
+        
         Args:
             message: The message triggering the greeting.
             
@@ -1335,57 +1374,17 @@ class GreeterCommand(BaseCommand):
             bool: True if executed successfully, False otherwise.
         """
         try:
-            # Double-check we should greet (race condition protection)
-            if not self.should_execute(message):
-                return False
-            
             # Mark as greeted BEFORE scheduling greeting (to prevent duplicate greetings)
-            # This ensures we don't greet the same user twice even if there's a delay
-            # mark_as_greeted uses atomic INSERT OR IGNORE to handle race conditions
-            marked = self.mark_as_greeted(message.sender_id, message.channel)
-            if not marked:
+            # This ensures we don't greet the same user twice even if there's a delay.
+            # The caller has already run should_execute; the atomic insert is the race guard:
+            # if the row already exists, another process (or message) greeted this user first.
+            inserted = self._insert_greeted(message.sender_id, message.channel)
+            if inserted is None:
                 self.logger.warning(f"Failed to mark {message.sender_id} as greeted - aborting greeting")
                 return False
-            
-            # Final verification: Double-check that user hasn't been greeted by another process
-            # This is a last-ditch check to catch any race conditions
-            # The INSERT OR IGNORE in mark_as_greeted() should have handled this, but we verify
-            if self.has_been_greeted(message.sender_id, message.channel):
-                # User is marked - verify this is a fresh mark (not an old one)
-                # If the record was just created (within last 5 seconds), we likely created it
-                # If it's older, another process may have created it first
-                try:
-                    with self.bot.db_manager.connection() as conn:
-                        cursor = conn.cursor()
-                        if self.per_channel_greetings:
-                            cursor.execute('''
-                                SELECT datetime(greeted_at) as greeted_at, datetime('now') as now
-                                FROM greeted_users
-                                WHERE sender_id = ? AND channel = ?
-                            ''', (message.sender_id, message.channel))
-                        else:
-                            cursor.execute('''
-                                SELECT datetime(greeted_at) as greeted_at, datetime('now') as now
-                                FROM greeted_users
-                                WHERE sender_id = ? AND channel IS NULL
-                            ''', (message.sender_id,))
-                        result = cursor.fetchone()
-                        if result:
-                            greeted_at_str, now_str = result
-                            greeted_at = datetime.fromisoformat(greeted_at_str)
-                            now = datetime.fromisoformat(now_str)
-                            seconds_ago = (now - greeted_at).total_seconds()
-                            
-                            # If marked more than 5 seconds ago, likely another process did it first
-                            # (our mark_as_greeted should have just run, so it should be very recent)
-                            if seconds_ago > 5:
-                                self.logger.info(f"User {message.sender_id} was already greeted {seconds_ago:.1f}s ago by another process - aborting duplicate greeting")
-                                return False
-                            else:
-                                self.logger.debug(f"User {message.sender_id} marked {seconds_ago:.1f}s ago - proceeding with greeting")
-                except Exception as e:
-                    # If check fails, proceed anyway (better to greet than miss a greeting)
-                    self.logger.debug(f"Could not verify greeting timestamp (proceeding anyway): {e}")
+            if not inserted:
+                self.logger.info(f"User {message.sender_id} was already marked as greeted by another process - aborting duplicate greeting")
+                return False
             
             # Check if dead air delay is enabled
             if self.dead_air_delay_seconds > 0:
@@ -1421,19 +1420,27 @@ class GreeterCommand(BaseCommand):
         if message.is_dm or not message.channel:
             return
         
+        if not self.pending_greetings or not message.content:
+            return
+        
+        # Lowercase and split the message once, not once per pending greeting
+        content_lower = message.content.lower()
+        words = None
+        
         # Check all pending greetings for this channel
         keys_to_cancel = []
         for (sender_id, channel), task in list(self.pending_greetings.items()):
             if channel == message.channel and sender_id != message.sender_id:
                 # Check if this message mentions the pending user
-                if message.content and sender_id.lower() in message.content.lower():
+                sender_lower = sender_id.lower()
+                if sender_lower in content_lower:
                     # Also check with Levenshtein distance if enabled
                     should_cancel = False
                     if self.levenshtein_distance > 0:
-                        words = message.content.lower().split()
+                        if words is None:
+                            words = [word.strip('.,!?;:()[]{}@') for word in content_lower.split()]
                         for word in words:
-                            word = word.strip('.,!?;:()[]{}@')
-                            distance = self._levenshtein_distance(sender_id.lower(), word)
+                            distance = self._levenshtein_distance(sender_lower, word, self.levenshtein_distance)
                             if distance <= self.levenshtein_distance:
                                 should_cancel = True
                                 break
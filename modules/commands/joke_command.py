@@ -62,6 +62,28 @@ class JokeCommand(BaseCommand):
             self.joke_enabled = self.get_config_value('Joke_Command', 'joke_enabled', fallback=True, value_type='bool')
         self.seasonal_jokes = self.get_config_value('Joke_Command', 'seasonal_jokes', fallback=True, value_type='bool')
         self.long_jokes = self.get_config_value('Joke_Command', 'long_jokes', fallback=False, value_type='bool')
+        
+        # HTTP session reused across requests (created lazily in the running event loop)
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp session used for JokeAPI requests.
+        
+        Returns:
+            aiohttp.ClientSession: Session with the API timeout applied.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.TIMEOUT),
+                connector=aiohttp.TCPConnector(limit_per_host=4, ttl_dns_cache=300)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     def get_help_text(self, message: MeshMessage = None) -> str:
         """Get help text, excluding dark category if not in DM"""
@@ -75,6 +97,13 @@ class JokeCommand(BaseCommand):
             categories = ", ".join(self.SUPPORTED_CATEGORIES.keys())
             return f"Usage: joke [category] - Get a random joke or from categories: {categories}"
     
+    def _load_translated_keywords(self):
+        """Load translated keywords and precompute the lowercased match tables."""
+        super()._load_translated_keywords()
+        keywords_lower = [keyword.lower() for keyword in self.keywords]
+        self._keywords_lower = frozenset(keywords_lower)
+        self._keyword_prefixes = tuple(keyword + ' ' for keyword in keywords_lower)
+    
     def matches_keyword(self, message: MeshMessage) -> bool:
         """Check if message starts with a joke keyword.
         
@@ -88,11 +117,8 @@ class JokeCommand(BaseCommand):
         if content.startswith('!'):
             content = content[1:].strip()
         content_lower = content.lower()
-        for keyword in self.keywords:
-            # Match if keyword is at start followed by space or end of message
-            if content_lower == keyword or content_lower.startswith(keyword + ' '):
-                return True
-        return False
+        # Match if keyword is at start followed by space or end of message
+        return content_lower in self._keywords_lower or content_lower.startswith(self._keyword_prefixes)
     
     def can_execute(self, message: MeshMessage) -> bool:
         """Override to add custom checks (joke_enabled, dark joke) while using base class cooldown"""
@@ -216,42 +242,42 @@ class JokeCommand(BaseCommand):
             self.logger.debug(f"Fetching joke from: {url}")
             
             # Make the API request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=self.TIMEOUT)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Check if the API returned an error
-                        if data.get('error', False):
-                            self.logger.warning(f"JokeAPI returned error: {data.get('message', 'Unknown error')}")
-                            return None
-                        
-                        # Check flags to ensure it's clean (always check blacklist flags)
-                        flags = data.get('flags', {})
-                        if any(flags.get(flag, False) for flag in ['nsfw', 'religious', 'political', 'racist', 'sexist', 'explicit']):
-                            self.logger.warning("JokeAPI returned flagged joke, skipping")
-                            return None
-                        
-                        # For dark jokes, we allow safe: false since users expect dark humor
-                        # For other categories, we require safe: true (when not using safe-mode)
-                        if category and category.lower() == 'dark':
-                            # Dark jokes can have safe: false, just check blacklist flags
-                            self.logger.debug("Dark joke accepted (safe: false allowed for dark humor)")
-                        else:
-                            # For non-dark jokes, ensure they're safe
-                            if not data.get('safe', False):
-                                self.logger.warning("JokeAPI returned unsafe joke for non-dark category, skipping")
-                                return None
-                        
-                        return data
-                    elif response.status == 400:
-                        # 400 error usually means no jokes available for this category
-                        self.logger.info(f"No jokes available for category: {category}")
+            session = await self._get_session()
+            async with session.get(url) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    
+                    # Check if the API returned an error
+                    if data.get('error', False):
+                        self.logger.warning(f"JokeAPI returned error: {data.get('message', 'Unknown error')}")
                         return None
-                    else:
-                        self.logger.error(f"JokeAPI returned status {response.status}")
+                    
+                    # Check flags to ensure it's clean (always check blacklist flags)
+                    flags = data.get('flags', {})
+                    if any(flags.get(flag, False) for flag in ['nsfw', 'religious', 'political', 'racist', 'sexist', 'explicit']):
+                        self.logger.warning("JokeAPI returned flagged joke, skipping")
                         return None
-                        
+                    
+                    # For dark jokes, we allow safe: false since users expect dark humor
+                    # For other categories, we require safe: true (when not using safe-mode)
+                    if category and category.lower() == 'dark':
+                        # Dark jokes can have safe: false, just check blacklist flags
+                        self.logger.debug("Dark joke accepted (safe: false allowed for dark humor)")
+                    else:
+                        # For non-dark jokes, ensure they're safe
+                        if not data.get('safe', False):
+                            self.logger.warning("JokeAPI returned unsafe joke for non-dark category, skipping")
+                            return None
+                    
+                    return data
+                elif response.status == 400:
+                    # 400 error usually means no jokes available for this category
+                    self.logger.info(f"No jokes available for category: {category}")
+                    return None
+                else:
+                    self.logger.error(f"JokeAPI returned status {response.status}")
+                    return None
+                    
         except asyncio.TimeoutError:
             self.logger.error("Timeout fetching joke from JokeAPI")
             return None
@@ -240,6 +240,7 @@ class MeshCoreBot:
             for cmd_name, cmd_instance in self.command_manager.commands.items():
                 if hasattr(cmd_instance, '_load_translated_keywords'):
                     cmd_instance._load_translated_keywords()
+            self.command_manager.invalidate_keyword_index()
         
         # Advert tracking
         self.last_advert_time = None
@@ -385,6 +386,7 @@ class MeshCoreBot:
                         for cmd_name, cmd_instance in self.command_manager.commands.items():
                             if hasattr(cmd_instance, '_load_translated_keywords'):
                                 cmd_instance._load_translated_keywords()
+                        self.command_manager.invalidate_keyword_index()
             except (OSError, ValueError, FileNotFoundError, json.JSONDecodeError) as e:
                 self.logger.warning(f"Failed to reload translator: {e}")
             
@@ -398,6 +400,10 @@ class MeshCoreBot:
                 self.command_manager.banned_users = self.command_manager.load_banned_users()
                 self.command_manager.monitor_channels = self.command_manager.load_monitor_channels()
                 self.command_manager.channel_keywords = self.command_manager.load_channel_keywords()
+                for cmd_instance in self.command_manager.commands.values():
+                    if hasattr(cmd_instance, 'on_config_reloaded'):
+                        cmd_instance.on_config_reloaded()
+                self.command_manager.invalidate_keyword_index()
                 self.logger.info("Command manager config reloaded")
             
             # Update scheduler (scheduled messages)
@@ -1351,6 +1357,14 @@ long_jokes = false
         if self.feed_manager:
             await self.feed_manager.stop()
         
+        # Release resources held by commands (e.g. HTTP sessions)
+        if hasattr(self, 'command_manager'):
+            for cmd_name, cmd_instance in self.command_manager.commands.items():
+                try:
+                    await cmd_instance.close()
+                except Exception as e:
+                    self.logger.warning(f"Error closing command '{cmd_name}': {e}")
+        
         # Stop all loaded services
         for service_name, service_instance in self.services.items():
             try:
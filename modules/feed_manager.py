@@ -56,6 +56,11 @@ class FeedManager:
         # HTTP session
         self.session: Optional[aiohttp.ClientSession] = None
         
+        # Cache validators (ETag / Last-Modified) from the last 200 response per RSS feed
+        # subscription (feed id, since one URL can be subscribed on several channels), sent
+        # back as conditional request headers so unchanged feeds answer 304 with no body
+        self._rss_validators: Dict[int, Dict[str, str]] = {}
+        
         # Semaphore to limit concurrent requests
         self._request_semaphore = asyncio.Semaphore(5)
         
@@ -188,14 +193,21 @@ class FeedManager:
             if new_items:
                 self.logger.info(f"Found {len(new_items)} new items for feed {feed_id}")
                 filtered_count = 0
+                # Items left unqueued (over max_items_per_check or failed) are picked up by
+                # the next poll, which must not be answered with a 304
+                all_queued = len(new_items) <= self.max_items_per_check
                 for item in new_items[:self.max_items_per_check]:
                     # Check if item passes filter conditions
                     if self._should_send_item(feed, item):
-                        await self._send_feed_item(feed, item)
+                        if not await self._send_feed_item(feed, item):
+                            all_queued = False
                     else:
                         filtered_count += 1
                         self.logger.debug(f"Filtered out item: {item.get('title', 'Untitled')[:50]}")
                 
+                if not all_queued:
+                    self._rss_validators.pop(feed_id, None)
+                
                 if filtered_count > 0:
                     self.logger.debug(f"Filtered out {filtered_count} items for feed {feed_id}")
             else:
@@ -207,6 +219,7 @@ class FeedManager:
         except Exception as e:
             self.logger.error(f"Error polling feed {feed_id}: {e}")
             self._record_feed_error(feed_id, 'network', str(e))
+            self._rss_validators.pop(feed_id, None)
     
     async def process_rss_feed(self, feed: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process an RSS feed and return new items"""
@@ -220,10 +233,17 @@ class FeedManager:
             
             async with self._request_semaphore:
                 try:
-                    async with self.session.get(feed_url, timeout=timeout) as response:
+                    async with self.session.get(
+                        feed_url, headers=self._rss_validators.get(feed['id']), timeout=timeout
+                    ) as response:
+                        if response.status == 304:
+                            # Feed unchanged since the last fetch, so nothing new
+                            self.logger.debug(f"RSS feed {feed['id']} not modified")
+                            return []
                         if response.status != 200:
                             raise Exception(f"HTTP {response.status}")
                         content = await response.text()
+                        self._store_rss_validators(feed['id'], response.headers)
                 except (asyncio.TimeoutError, aiohttp.ServerTimeoutError):
                     raise Exception(f"Request timeout after {self.request_timeout} seconds")
             
@@ -314,6 +334,20 @@ class FeedManager:
             self.logger.error(f"Error processing RSS feed: {e}")
             raise
     
+    def _store_rss_validators(self, feed_id: int, headers: Any) -> None:
+        """Remember ETag / Last-Modified from an RSS response for the next conditional request"""
+        validators = {}
+        etag = headers.get('ETag')
+        if etag:
+            validators['If-None-Match'] = etag
+        last_modified = headers.get('Last-Modified')
+        if last_modified:
+            validators['If-Modified-Since'] = last_modified
+        if validators:
+            self._rss_validators[feed_id] = validators
+        else:
+            self._rss_validators.pop(feed_id, None)
+    
     async def process_api_feed(self, feed: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process an API feed and return new items"""
         feed_url = feed['feed_url']
@@ -951,8 +985,8 @@ class FeedManager:
         
         return message
     
-    def _queue_feed_message(self, feed: Dict[str, Any], item: Dict[str, Any], message: str):
-        """Queue a feed message for later sending"""
+    def _queue_feed_message(self, feed: Dict[str, Any], item: Dict[str, Any], message: str) -> bool:
+        """Queue a feed message for later sending. Returns True if it was queued."""
         try:
             with self.bot.db_manager.connection() as conn:
                 cursor = conn.cursor()
@@ -969,9 +1003,11 @@ class FeedManager:
                 ))
                 conn.commit()
                 self.logger.debug(f"Queued feed message for {feed['channel_name']}: {item.get('title', '')[:50]}")
+                return True
         except Exception as e:
             self.logger.error(f"Error queuing feed message: {e}")
             self._record_feed_error(feed['id'], 'queue', str(e))
+            return False
     
     def _should_send_item(self, feed: Dict[str, Any], item: Dict[str, Any]) -> bool:
         """Check if an item should be sent based on filter configuration
@@ -1087,15 +1123,16 @@ class FeedManager:
         else:  # AND (default)
             return all(results)
     
-    async def _send_feed_item(self, feed: Dict[str, Any], item: Dict[str, Any]):
-        """Queue a feed item message instead of sending immediately"""
+    async def _send_feed_item(self, feed: Dict[str, Any], item: Dict[str, Any]) -> bool:
+        """Queue a feed item message instead of sending immediately. Returns True if it was queued."""
         try:
             message = self.format_message(item, feed)
             # Queue the message instead of sending immediately
-            self._queue_feed_message(feed, item, message)
+            return self._queue_feed_message(feed, item, message)
         except Exception as e:
             self.logger.error(f"Error processing feed item: {e}")
             self._record_feed_error(feed['id'], 'other', str(e))
+            return False
     
     async def _wait_for_rate_limit(self, domain: str):
         """Wait if needed to respect rate limits"""
@@ -199,3 +199,42 @@ class TestCanExecute:
         cmd = PingCommand(command_mock_bot)
         msg = mock_message(content="ping", is_dm=True)
         assert cmd.can_execute(msg) is True
+
+
+class TestCooldowns:
+    """Tests for per-user cooldown tracking."""
+
+    def test_cooldowns_not_shared_between_instances(self, command_mock_bot):
+        cmd1 = _TestCommand(command_mock_bot)
+        cmd2 = _TestCommand(command_mock_bot)
+        cmd1.cooldown_seconds = cmd2.cooldown_seconds = 60
+        cmd1.record_execution("Alice")
+        assert cmd1.check_cooldown("Alice")[0] is False
+        assert cmd2.check_cooldown("Alice")[0] is True
+
+    def test_stale_entries_evicted_when_full(self, command_mock_bot):
+        cmd = _TestCommand(command_mock_bot)
+        cmd.cooldown_seconds = 1
+        cmd._user_cooldowns = {f"user{i}": float('-inf') for i in range(cmd._USER_COOLDOWN_MAX_ENTRIES)}
+        cmd.record_execution("Alice")
+        assert list(cmd._user_cooldowns) == ["Alice"]
+
+    def test_cooldowns_capped_when_all_active(self, command_mock_bot):
+        cmd = _TestCommand(command_mock_bot)
+        cmd.cooldown_seconds = 60
+        for i in range(cmd._USER_COOLDOWN_MAX_ENTRIES + 10):
+            cmd.record_execution(f"user{i}")
+        assert len(cmd._user_cooldowns) == cmd._USER_COOLDOWN_MAX_ENTRIES
+        assert "user0" not in cmd._user_cooldowns
+        assert f"user{cmd._USER_COOLDOWN_MAX_ENTRIES + 9}" in cmd._user_cooldowns
+
+    def test_repeat_execution_refreshes_recency(self, command_mock_bot):
+        cmd = _TestCommand(command_mock_bot)
+        cmd.cooldown_seconds = 60
+        cmd.record_execution("Alice")
+        for i in range(cmd._USER_COOLDOWN_MAX_ENTRIES - 1):
+            cmd.record_execution(f"user{i}")
+        cmd.record_execution("Alice")
+        cmd.record_execution("Bob")
+        assert "Alice" in cmd._user_cooldowns
+        assert "user0" not in cmd._user_cooldowns
@@ -0,0 +1,52 @@
+"""Tests for modules.commands.catfact_command."""
+
+import pytest
+
+from modules.commands.catfact_command import CatfactCommand, _CAT_FACTS, _ERROR_MSG
+from tests.conftest import command_mock_bot, mock_message
+
+
+class TestCatfactCommand:
+    """Tests for CatfactCommand."""
+
+    def test_fallback_facts_are_unique(self):
+        assert isinstance(_CAT_FACTS, tuple)
+        assert len(_CAT_FACTS) == len(set(_CAT_FACTS))
+
+    def test_fallback_shared_across_instances(self, command_mock_bot):
+        cmd1 = CatfactCommand(command_mock_bot)
+        cmd2 = CatfactCommand(command_mock_bot)
+        assert cmd1.get_cat_facts() is _CAT_FACTS
+        assert cmd2.get_cat_facts() is _CAT_FACTS
+
+    def test_translated_facts_preferred(self, command_mock_bot):
+        command_mock_bot.translator.get_value.return_value = ["Translated fact"]
+        cmd = CatfactCommand(command_mock_bot)
+        assert cmd.get_cat_facts() == ["Translated fact"]
+
+    def test_can_execute_when_disabled(self, command_mock_bot):
+        command_mock_bot.config.add_section("Catfact_Command")
+        command_mock_bot.config.set("Catfact_Command", "enabled", "false")
+        cmd = CatfactCommand(command_mock_bot)
+        msg = mock_message(content="catfact", is_dm=True)
+        assert cmd.can_execute(msg) is False
+
+    @pytest.mark.asyncio
+    async def test_execute_sends_fact(self, command_mock_bot):
+        cmd = CatfactCommand(command_mock_bot)
+        msg = mock_message(content="catfact", is_dm=True)
+        result = await cmd.execute(msg)
+        assert result is True
+        call_args = command_mock_bot.command_manager.send_response.call_args
+        assert call_args is not None
+        assert call_args[0][1] in _CAT_FACTS
+
+    @pytest.mark.asyncio
+    async def test_execute_error_uses_fallback_message(self, command_mock_bot):
+        command_mock_bot.translator.get_value.return_value = []
+        cmd = CatfactCommand(command_mock_bot)
+        cmd.cat_facts_fallback = ()
+        msg = mock_message(content="catfact", is_dm=True)
+        result = await cmd.execute(msg)
+        assert result is True
+        assert command_mock_bot.command_manager.send_response.call_args[0][1] == _ERROR_MSG
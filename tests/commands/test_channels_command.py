@@ -0,0 +1,170 @@
+"""Tests for modules.commands.channels_command."""
+
+import pytest
+
+from modules.commands.channels_command import ChannelsCommand
+from tests.conftest import command_mock_bot, mock_message
+
+
+@pytest.fixture
+def channels_bot(command_mock_bot):
+    config = command_mock_bot.config
+    config.add_section("Channels_List")
+    config.set("Channels_List", "weather", "Weather updates")
+    config.set("Channels_List", "emergency", '"Emergency alerts"')
+    config.set("Channels_List", "sports.sounders", "Seattle Sounders FC")
+    config.set("Channels_List", "sports.kraken", "Seattle Kraken")
+    config.set("Channels_List", "ham.arrl", "ARRL news")
+    return command_mock_bot
+
+
+class TestChannelsCommand:
+    """Tests for ChannelsCommand."""
+
+    def test_load_general_channels(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        assert cmd._load_channels_from_config() == {
+            "#weather": "Weather updates",
+            "#emergency": "Emergency alerts",
+        }
+        assert cmd._load_channels_from_config("general") == cmd._load_channels_from_config()
+
+    def test_load_category_channels(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        assert cmd._load_channels_from_config("sports") == {
+            "#sounders": "Seattle Sounders FC",
+            "#kraken": "Seattle Kraken",
+        }
+        assert cmd._load_channels_from_config("unknown") == {}
+
+    def test_channel_index_is_read_only(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        channels = cmd._load_channels_from_config("sports")
+        assert channels is cmd._load_channels_from_config("sports")
+        with pytest.raises(TypeError):
+            channels["#new"] = "New"
+
+    def test_get_all_categories(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        assert cmd._get_all_categories() == {"general": 2, "sports": 2, "ham": 1}
+
+    def test_is_valid_category(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        assert cmd._is_valid_category("Sports") is True
+        assert cmd._is_valid_category("general") is False
+        assert cmd._is_valid_category("") is False
+
+    def test_config_reload_rebuilds_index(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        assert cmd._is_valid_category("ares") is False
+        channels_bot.config.set("Channels_List", "ares.county", "County ARES")
+        assert cmd._is_valid_category("ares") is False
+        cmd.on_config_reloaded()
+        assert cmd._is_valid_category("ares") is True
+
+    @pytest.mark.asyncio
+    async def test_execute_category(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        msg = mock_message(content="channels sports")
+        assert await cmd.execute(msg) is True
+        response = channels_bot.command_manager.send_response.call_args[0][1]
+        assert "#sounders" in response
+        assert "#kraken" in response
+
+    @pytest.mark.asyncio
+    async def test_execute_list_shows_categories(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        assert await cmd.execute(mock_message(content="!channels LIST")) is True
+        responses = [c[0][1] for c in channels_bot.command_manager.send_response.call_args_list]
+        assert any("commands.channels.category_count" in r for r in responses)
+
+    @pytest.mark.asyncio
+    async def test_rendered_messages_reused_until_reload(self, channels_bot, monkeypatch):
+        cmd = ChannelsCommand(channels_bot)
+        calls = []
+        original = cmd._iter_split_messages
+
+        def _spy(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(cmd, "_iter_split_messages", _spy)
+        for _ in range(2):
+            await cmd.execute(mock_message(content="channels sports"))
+            await cmd.execute(mock_message(content="channels list"))
+        assert len(calls) == 2
+        channels_bot.config.set("Channels_List", "sports.storm", "Seattle Storm")
+        cmd.on_config_reloaded()
+        await cmd.execute(mock_message(content="channels sports"))
+        assert len(calls) == 3
+        assert "#storm" in channels_bot.command_manager.send_response.call_args[0][1]
+
+    @pytest.mark.asyncio
+    async def test_execute_specific_channel(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        msg = mock_message(content="channels #kraken")
+        assert await cmd.execute(msg) is True
+        response = channels_bot.command_manager.send_response.call_args[0][1]
+        assert response == "#kraken: Seattle Kraken"
+
+    @pytest.mark.asyncio
+    async def test_execute_channel_search_by_name(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        msg = mock_message(content="channel Sounders")
+        assert await cmd.execute(msg) is True
+        response = channels_bot.command_manager.send_response.call_args[0][1]
+        assert response == "#sounders: Seattle Sounders FC"
+
+    def test_find_channel_by_name(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        assert cmd._find_channel_by_name("KRAKEN") == "kraken"
+        assert cmd._find_channel_by_name("weather") == "weather"
+        assert cmd._find_channel_by_name("sports") is None
+
+    @pytest.mark.asyncio
+    async def test_execute_unknown_specific_channel(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        assert await cmd.execute(mock_message(content="channels #nowhere")) is True
+        response = channels_bot.command_manager.send_response.call_args[0][1]
+        assert response.startswith("commands.channels.channel_not_found")
+
+    def test_matches_keyword(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        assert cmd.matches_keyword(mock_message(content="channels")) is True
+        assert cmd.matches_keyword(mock_message(content="!Channel list")) is True
+        assert cmd.matches_keyword(mock_message(content="channelsx")) is False
+        assert cmd.matches_keyword(mock_message(content="stats channels")) is False
+        assert cmd.matches_keyword(mock_message(content="channels?")) is True
+
+    def test_normalize_content(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        assert cmd._normalize_content("  ! Channels Sports ") == ("Channels Sports", "channels sports")
+        assert cmd._normalize_content("channel") == ("channel", "channel")
+
+    def test_split_into_messages_respects_limit(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        items = [f"#channel{i:02d}" for i in range(40)]
+        messages = cmd._split_into_messages(items, "sports")
+        assert len(messages) > 1
+        assert all(len(m) <= 130 for m in messages)
+        for item in items:
+            assert sum(m.count(item) for m in messages) == 1
+
+    def test_split_into_messages_oversized_first_item_sent_alone(self, channels_bot):
+        cmd = ChannelsCommand(channels_bot)
+        long_item = "#" + "x" * 140
+        messages = cmd._split_into_messages([long_item, "#short"], "sports")
+        assert len(messages) == 2
+        assert messages[0].endswith(long_item)
+        assert messages[1].endswith("#short")
+
+    @pytest.mark.asyncio
+    async def test_execute_sends_split_messages_in_order(self, channels_bot):
+        for i in range(30):
+            channels_bot.config.set("Channels_List", f"bulk{i:02d}", "Bulk channel")
+        cmd = ChannelsCommand(channels_bot)
+        expected = cmd._split_into_messages(list(cmd._load_channels_from_config()))
+        assert await cmd.execute(mock_message(content="channels")) is True
+        calls = channels_bot.command_manager.send_response.call_args_list
+        assert [c[0][1] for c in calls] == expected
+        assert [c[1]["skip_user_rate_limit"] for c in calls] == [False] + [True] * (len(expected) - 1)
@@ -0,0 +1,139 @@
+"""Tests for modules.commands.dadjoke_command."""
+
+import time
+
+import pytest
+
+from modules.commands.dadjoke_command import DadJokeCommand
+from tests.conftest import command_mock_bot, mock_message
+
+
+class TestDadJokeCommand:
+    """Tests for DadJokeCommand."""
+
+    def test_matches_keyword(self, command_mock_bot):
+        cmd = DadJokeCommand(command_mock_bot)
+        assert cmd.matches_keyword(mock_message(content="dadjoke")) is True
+        assert cmd.matches_keyword(mock_message(content="!Dad Joke please")) is True
+        assert cmd.matches_keyword(mock_message(content="dadjokes")) is True
+        assert cmd.matches_keyword(mock_message(content="dadjokez")) is False
+        assert cmd.matches_keyword(mock_message(content="tell me a dadjoke")) is False
+
+    @pytest.mark.asyncio
+    async def test_session_reused_and_closed(self, command_mock_bot):
+        cmd = DadJokeCommand(command_mock_bot)
+        session = await cmd._get_session()
+        assert await cmd._get_session() is session
+        await cmd.close()
+        assert session.closed
+        assert cmd._session is None
+
+    @pytest.mark.asyncio
+    async def test_full_fresh_cache_skips_api(self, command_mock_bot):
+        cmd = DadJokeCommand(command_mock_bot)
+        for i in range(cmd.JOKE_CACHE_SIZE):
+            cmd._cache_joke({'id': str(i), 'joke': f"Joke {i}", 'status': 200})
+        cmd._last_fetch_time = time.monotonic()
+
+        async def _fail():
+            raise AssertionError("API should not be called")
+
+        cmd.get_dad_joke_from_api = _fail
+        joke = await cmd.get_dad_joke_with_length_handling()
+        assert joke in cmd._joke_cache.values()
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_fetches_from_api(self, command_mock_bot):
+        cmd = DadJokeCommand(command_mock_bot)
+        for i in range(cmd.JOKE_CACHE_SIZE):
+            cmd._cache_joke({'id': str(i), 'joke': f"Joke {i}", 'status': 200})
+        cmd._last_fetch_time = time.monotonic() - cmd.cache_refill_seconds - 1
+        fresh = {'id': 'new', 'joke': "Fresh joke", 'status': 200}
+
+        async def _fetch():
+            return fresh
+
+        cmd.get_dad_joke_from_api = _fetch
+        assert await cmd.get_dad_joke_with_length_handling() is fresh
+
+    def test_can_execute_when_disabled(self, command_mock_bot):
+        command_mock_bot.config.add_section("DadJoke_Command")
+        command_mock_bot.config.set("DadJoke_Command", "enabled", "false")
+        cmd = DadJokeCommand(command_mock_bot)
+        assert cmd.can_execute(mock_message(content="dadjoke", is_dm=True)) is False
+
+    def test_format_dad_joke(self, command_mock_bot):
+        cmd = DadJokeCommand(command_mock_bot)
+        assert cmd.format_dad_joke({'joke': "Why?"}) == "🥸 Why?"
+        assert cmd.format_dad_joke({}) == "🥸 No dad joke content available"
+
+    def test_cache_keyed_by_id_and_bounded(self, command_mock_bot):
+        cmd = DadJokeCommand(command_mock_bot)
+        cmd._cache_joke({'id': 'a', 'joke': "First", 'status': 200})
+        cmd._cache_joke({'id': 'a', 'joke': "First", 'status': 200})
+        assert len(cmd._joke_cache) == 1
+        for i in range(cmd.JOKE_CACHE_SIZE):
+            cmd._cache_joke({'id': str(i), 'joke': f"Joke {i}", 'status': 200})
+        assert len(cmd._joke_cache) == cmd.JOKE_CACHE_SIZE
+        assert 'a' not in cmd._joke_cache
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_probability_skips_api(self, command_mock_bot):
+        cmd = DadJokeCommand(command_mock_bot)
+        cmd.cache_hit_probability = 1.0
+        cached = {'id': 'a', 'joke': "Cached", 'status': 200}
+        cmd._cache_joke(cached)
+
+        async def _fail():
+            raise AssertionError("API should not be called")
+
+        cmd.get_dad_joke_from_api = _fail
+        assert await cmd.get_dad_joke_with_length_handling() is cached
+
+    def test_split_dad_joke_prefers_break_nearest_middle(self, command_mock_bot):
+        cmd = DadJokeCommand(command_mock_bot)
+        joke = "Hi. " + "a" * 60 + ", then the setup? " + "b" * 60 + "."
+        part1, part2 = cmd.split_dad_joke(f"🥸 {joke}")
+        assert part1 == "🥸 Hi. " + "a" * 60 + ","
+        assert part2 == "🥸 then the setup? " + "b" * 60 + "."
+
+    def test_split_dad_joke_falls_back_to_space(self, command_mock_bot):
+        cmd = DadJokeCommand(command_mock_bot)
+        assert cmd.split_dad_joke("🥸 aaaa bbbb cccc") == ["🥸 aaaa bbbb", "🥸 cccc"]
+
+    @pytest.mark.asyncio
+    async def test_long_joke_retries_in_one_concurrent_batch(self, command_mock_bot):
+        cmd = DadJokeCommand(command_mock_bot)
+        cmd.long_jokes = False
+        long_joke = {'id': 'long', 'joke': "x" * 200, 'status': 200}
+        short_joke = {'id': 'short', 'joke': "Short", 'status': 200}
+        responses = [long_joke, long_joke, short_joke, long_joke, long_joke]
+
+        async def _fetch():
+            return responses.pop(0)
+
+        cmd.get_dad_joke_from_api = _fetch
+        assert await cmd.get_dad_joke_with_length_handling() is short_joke
+        assert responses == []
+
+    @pytest.mark.asyncio
+    async def test_all_long_jokes_returns_last(self, command_mock_bot):
+        cmd = DadJokeCommand(command_mock_bot)
+        cmd.long_jokes = False
+        calls = []
+
+        async def _fetch():
+            calls.append(1)
+            return {'id': str(len(calls)), 'joke': "x" * 200, 'status': 200}
+
+        cmd.get_dad_joke_from_api = _fetch
+        joke = await cmd.get_dad_joke_with_length_handling()
+        assert len(calls) == sum(cmd.FETCH_BATCHES)
+        assert joke['id'] == str(len(calls))
+
+    def test_format_dad_joke_memoized_on_joke(self, command_mock_bot):
+        cmd = DadJokeCommand(command_mock_bot)
+        joke = {'id': 'a', 'joke': "Why?", 'status': 200}
+        first = cmd.format_dad_joke(joke)
+        assert joke['_formatted'] == "🥸 Why?"
+        assert cmd.format_dad_joke(joke) is first
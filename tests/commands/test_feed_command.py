@@ -0,0 +1,97 @@
+"""Tests for modules.commands.feed_command."""
+
+import pytest
+
+from modules.commands.feed_command import FeedCommand
+from tests.conftest import command_mock_bot, mock_message
+
+
+@pytest.fixture
+def feed_bot(command_mock_bot, test_db):
+    command_mock_bot.db_manager = test_db
+    return command_mock_bot
+
+
+class TestFeedCommand:
+    """Tests for FeedCommand subscription storage."""
+
+    def test_subscription_round_trip(self, feed_bot):
+        cmd = FeedCommand(feed_bot)
+        feed_id = cmd._create_subscription("rss", "https://example.com/rss", "emergency", "Alerts")
+        feed = cmd._get_subscription_by_id(feed_id)
+        assert feed["feed_url"] == "https://example.com/rss"
+        assert feed["feed_name"] == "Alerts"
+        assert [f["id"] for f in cmd._get_subscriptions("emergency")] == [feed_id]
+        assert cmd._set_subscription_enabled(feed_id, False) is True
+        assert cmd._get_subscription_by_id(feed_id)["enabled"] == 0
+        assert cmd._update_subscription(feed_id, 600) is True
+        assert cmd._get_subscription_by_id(feed_id)["check_interval_seconds"] == 600
+        assert cmd._delete_subscription_by_url("https://example.com/rss", "emergency") is True
+        assert cmd._get_subscription_by_id(feed_id) is None
+        assert cmd._delete_subscription_by_id(feed_id) is False
+
+    @pytest.mark.asyncio
+    async def test_status_reads_subscription(self, feed_bot):
+        cmd = FeedCommand(feed_bot)
+        feed_id = cmd._create_subscription("rss", "https://example.com/rss", "emergency", "Alerts")
+        assert await cmd.execute(mock_message(content=f"feed status {feed_id}", is_dm=True))
+        response = feed_bot.command_manager.send_response.call_args[0][1]
+        assert f"Feed {feed_id} Status:" in response
+        assert "URL: https://example.com/rss" in response
+
+    @pytest.mark.asyncio
+    async def test_enable_disable_unknown_feed(self, feed_bot):
+        cmd = FeedCommand(feed_bot)
+        await cmd.execute(mock_message(content="feed disable 42", is_dm=True))
+        assert feed_bot.command_manager.send_response.call_args[0][1] == "Feed subscription 42 not found"
+
+    def test_get_subscriptions_paged_and_counted(self, feed_bot):
+        cmd = FeedCommand(feed_bot)
+        ids = [cmd._create_subscription("rss", f"https://example.com/{i}", "emergency") for i in range(5)]
+        cmd._create_subscription("rss", "https://example.com/other", "general")
+        assert [f["id"] for f in cmd._get_subscriptions("emergency", limit=2, offset=1)] == ids[1:3]
+        assert len(cmd._get_subscriptions()) == 6
+        assert "api_config" not in cmd._get_subscriptions(limit=1)[0].keys()
+        assert cmd._count_subscriptions("emergency") == 5
+        assert cmd._count_subscriptions() == 6
+
+    @pytest.mark.asyncio
+    async def test_list_reports_overflow(self, feed_bot):
+        cmd = FeedCommand(feed_bot)
+        for i in range(cmd.LIST_PAGE_SIZE + 3):
+            cmd._create_subscription("rss", f"https://example.com/{i}", "emergency")
+        await cmd.execute(mock_message(content="feed list", is_dm=True))
+        response = feed_bot.command_manager.send_response.call_args[0][1]
+        assert response.startswith(f"Feed Subscriptions ({cmd.LIST_PAGE_SIZE + 3}):")
+        assert response.endswith("(3 more...)")
+
+    def test_validate_url(self, feed_bot):
+        cmd = FeedCommand(feed_bot)
+        assert cmd._validate_url("https://example.com/rss?x=1") is True
+        assert cmd._validate_url("HTTP://example.com") is True
+        assert cmd._validate_url("ftp://example.com/feed") is False
+        assert cmd._validate_url("https:///path-only") is False
+        assert cmd._validate_url("example.com/rss") is False
+
+    def test_channel_filter_uses_index(self, feed_bot):
+        with feed_bot.db_manager.connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM feed_subscriptions WHERE channel_name = ? ORDER BY id",
+                ("emergency",),
+            ).fetchall()
+        assert any("idx_feed_subscriptions_channel" in row[-1] for row in plan)
+
+    @pytest.mark.asyncio
+    async def test_unknown_subcommand_shows_help(self, feed_bot):
+        cmd = FeedCommand(feed_bot)
+        await cmd.execute(mock_message(content="feed bogus", is_dm=True))
+        assert feed_bot.command_manager.send_response.call_args[0][1] == cmd.get_help_text()
+
+    @pytest.mark.asyncio
+    async def test_enable_subcommand_dispatch(self, feed_bot):
+        cmd = FeedCommand(feed_bot)
+        feed_id = cmd._create_subscription("rss", "https://example.com/rss", "emergency")
+        await cmd.execute(mock_message(content=f"!feed DISABLE {feed_id}", is_dm=True))
+        assert feed_bot.command_manager.send_response.call_args[0][1] == f"Feed {feed_id} disabled"
+        await cmd.execute(mock_message(content=f"feed enable {feed_id}", is_dm=True))
+        assert cmd._get_subscription_by_id(feed_id)["enabled"] == 1
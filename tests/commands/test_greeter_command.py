@@ -0,0 +1,469 @@
+"""Tests for modules.commands.greeter_command."""
+
+import logging
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from modules.commands.greeter_command import GreeterCommand
+from tests.conftest import command_mock_bot, mock_message
+
+
+@pytest.fixture
+def greeter_bot(command_mock_bot, test_db):
+    config = command_mock_bot.config
+    config.add_section("Greeter_Command")
+    config.set("Greeter_Command", "enabled", "true")
+    config.set("Greeter_Command", "rollout_days", "0")
+    command_mock_bot.db_manager = test_db
+    with test_db.connection() as conn:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS message_stats (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp INTEGER NOT NULL,
+                sender_id TEXT NOT NULL,
+                channel TEXT,
+                content TEXT NOT NULL,
+                is_dm BOOLEAN NOT NULL
+            )
+        ''')
+        conn.commit()
+    return command_mock_bot
+
+
+def _add_messages(bot, rows):
+    now = int(time.time())
+    with bot.db_manager.connection() as conn:
+        conn.executemany(
+            'INSERT INTO message_stats (timestamp, sender_id, channel, content, is_dm) VALUES (?, ?, ?, ?, ?)',
+            [(now, sender_id, channel, 'hi', is_dm) for sender_id, channel, is_dm in rows],
+        )
+        conn.commit()
+
+
+def _greeted_rows(bot):
+    with bot.db_manager.connection() as conn:
+        return sorted(
+            (row['sender_id'], row['channel'])
+            for row in conn.execute('SELECT sender_id, channel FROM greeted_users')
+        )
+
+
+def _start_rollout_row(bot):
+    with bot.db_manager.connection() as conn:
+        cursor = conn.execute(
+            "INSERT INTO greeter_rollout (rollout_started_at, rollout_days) VALUES (datetime('now', '-1 hour'), 7)"
+        )
+        conn.commit()
+        return cursor.lastrowid
+
+
+def _active_users_marked(bot, rollout_id):
+    with bot.db_manager.connection() as conn:
+        return conn.execute(
+            'SELECT active_users_marked FROM greeter_rollout WHERE id = ?', (rollout_id,)
+        ).fetchone()[0]
+
+
+class TestGreeterCommand:
+    """Tests for GreeterCommand greeted-user tracking."""
+
+    def test_mark_active_users_global_mode(self, greeter_bot):
+        cmd = GreeterCommand(greeter_bot)
+        _add_messages(greeter_bot, [
+            ("Alice", "general", 0),
+            ("Alice", "test", 0),
+            ("Bob", "general", 0),
+            ("Carol", None, 1),
+        ])
+        cmd.mark_as_greeted("Bob", "general")
+        rollout_id = _start_rollout_row(greeter_bot)
+        cmd._mark_active_users_as_greeted(rollout_id)
+        assert _greeted_rows(greeter_bot) == [("Alice", None), ("Bob", None)]
+        assert _active_users_marked(greeter_bot, rollout_id) == 1
+        cmd._mark_active_users_as_greeted(rollout_id)
+        assert _greeted_rows(greeter_bot) == [("Alice", None), ("Bob", None)]
+        assert _active_users_marked(greeter_bot, rollout_id) == 1
+
+    def test_mark_active_users_per_channel_mode(self, greeter_bot):
+        greeter_bot.config.set("Greeter_Command", "per_channel_greetings", "true")
+        cmd = GreeterCommand(greeter_bot)
+        _add_messages(greeter_bot, [
+            ("Alice", "general", 0),
+            ("Alice", "test", 0),
+            ("Bob", "general", 0),
+        ])
+        rollout_id = _start_rollout_row(greeter_bot)
+        cmd._mark_active_users_as_greeted(rollout_id)
+        assert _greeted_rows(greeter_bot) == [
+            ("Alice", "general"), ("Alice", "test"), ("Bob", "general"),
+        ]
+        assert _active_users_marked(greeter_bot, rollout_id) == 3
+
+    def test_backfill_global_mode(self, greeter_bot):
+        cmd = GreeterCommand(greeter_bot)
+        _add_messages(greeter_bot, [
+            ("Alice", "general", 0),
+            ("Alice", "test", 0),
+            ("Bob", "general", 0),
+            ("Carol", None, 1),
+            ("Dave", "", 0),
+        ])
+        cmd.mark_as_greeted("Bob", "general")
+        result = cmd.backfill_greeted_users()
+        assert result["success"] is True
+        assert (result["marked_count"], result["skipped_count"], result["total_users_found"]) == (1, 1, 2)
+        assert _greeted_rows(greeter_bot) == [("Alice", None), ("Bob", None)]
+        assert cmd.backfill_greeted_users()["marked_count"] == 0
+
+    def test_backfill_per_channel_respects_lookback(self, greeter_bot):
+        greeter_bot.config.set("Greeter_Command", "per_channel_greetings", "true")
+        cmd = GreeterCommand(greeter_bot)
+        _add_messages(greeter_bot, [("Alice", "general", 0), ("Alice", "test", 0)])
+        with greeter_bot.db_manager.connection() as conn:
+            conn.execute(
+                "INSERT INTO message_stats (timestamp, sender_id, channel, content, is_dm) VALUES (?, 'Old', 'general', 'hi', 0)",
+                (int(time.time()) - 10 * 86400,),
+            )
+            conn.commit()
+        result = cmd.backfill_greeted_users(lookback_days=1)
+        assert result["marked_count"] == 2
+        assert _greeted_rows(greeter_bot) == [("Alice", "general"), ("Alice", "test")]
+        assert cmd.backfill_greeted_users()["marked_count"] == 1
+
+    def test_init_switches_database_to_wal(self, greeter_bot):
+        cmd = GreeterCommand(greeter_bot)
+        assert cmd._wal_enabled is True
+        with greeter_bot.db_manager.connection() as conn:
+            assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        with cmd._write_connection() as conn:
+            assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1
+            assert conn.execute('PRAGMA temp_store').fetchone()[0] == 2
+
+    @pytest.mark.parametrize("query", [
+        "SELECT DISTINCT sender_id, channel FROM message_stats"
+        " WHERE is_dm = 0 AND channel IS NOT NULL AND channel != '' AND timestamp >= ?",
+        "SELECT COUNT(DISTINCT sender_id) FROM message_stats WHERE timestamp >= ? AND is_dm = 0",
+    ])
+    def test_public_message_queries_use_covering_index(self, greeter_bot, query):
+        GreeterCommand(greeter_bot)
+        with greeter_bot.db_manager.connection() as conn:
+            plan = conn.execute('EXPLAIN QUERY PLAN ' + query, (0,)).fetchall()
+        assert any('COVERING INDEX idx_msgstats_public_activity' in row[3] for row in plan)
+
+    def test_has_been_greeted_uses_cache(self, greeter_bot):
+        cmd = GreeterCommand(greeter_bot)
+        assert cmd.has_been_greeted("Alice", "general") is False
+        cmd.mark_as_greeted("Alice", "general")
+        assert ("Alice", None) in cmd._greeted_cache
+        greeter_bot.db_manager = None  # any database access would now fail
+        assert cmd.has_been_greeted("Alice", "test") is True
+
+    def test_greeted_cache_reloads_after_ttl(self, greeter_bot):
+        cmd = GreeterCommand(greeter_bot)
+        cmd.mark_as_greeted("Alice", "general")
+        assert cmd.has_been_greeted("Alice", "general") is True
+        with greeter_bot.db_manager.connection() as conn:
+            conn.execute("DELETE FROM greeted_users WHERE sender_id = 'Alice'")
+            conn.commit()
+        assert cmd.has_been_greeted("Alice", "general") is True
+        cmd._greeted_cache_expires = 0.0
+        assert cmd.has_been_greeted("Alice", "general") is False
+
+    def test_greeted_cache_sees_bulk_inserts(self, greeter_bot):
+        cmd = GreeterCommand(greeter_bot)
+        assert cmd.has_been_greeted("Alice", "general") is False
+        _add_messages(greeter_bot, [("Alice", "general", 0)])
+        cmd.backfill_greeted_users()
+        assert cmd.has_been_greeted("Alice", "general") is True
+
+    @pytest.mark.asyncio
+    async def test_format_greeting_parts_uses_channel_greeting(self, greeter_bot):
+        config = greeter_bot.config
+        config.set("Greeter_Command", "include_mesh_info", "false")
+        config.set("Greeter_Command", "greeting_message", "Hi {sender}!|Be nice")
+        config.set("Greeter_Command", "channel_greetings", "General:Welcome to general {sender}!|Read the rules")
+        cmd = GreeterCommand(greeter_bot)
+        assert cmd.greeting_parts == ("Hi {sender}!", "Be nice")
+        assert cmd.channel_greetings["general"]["parts"] == ("Welcome to general {sender}!", "Read the rules")
+        assert await cmd._format_greeting_parts("Alice", "general", mesh_info={}) == [
+            "Welcome to general Alice!", "Read the rules",
+        ]
+        assert await cmd._format_greeting_parts("Alice", "test", mesh_info={}) == ["Hi Alice!", "Be nice"]
+        assert await cmd._format_greeting_parts("Alice", None, mesh_info={}) == ["Hi Alice!", "Be nice"]
+
+    def test_check_rollout_period(self, greeter_bot):
+        cmd = GreeterCommand(greeter_bot)
+        _add_messages(greeter_bot, [("Alice", "general", 0)])
+        rollout_id = _start_rollout_row(greeter_bot)
+        cmd._check_rollout_period()
+        assert _greeted_rows(greeter_bot) == [("Alice", None)]
+        with greeter_bot.db_manager.connection() as conn:
+            conn.execute("UPDATE greeter_rollout SET rollout_started_at = datetime('now', '-8 days')")
+            conn.commit()
+        cmd._check_rollout_period()
+        with greeter_bot.db_manager.connection() as conn:
+            completed = conn.execute(
+                'SELECT rollout_completed FROM greeter_rollout WHERE id = ?', (rollout_id,)
+            ).fetchone()[0]
+        assert completed == 1
+
+    def test_greeted_users_count(self, greeter_bot):
+        cmd = GreeterCommand(greeter_bot)
+        assert cmd.get_greeted_users_count() == 0
+        cmd.mark_as_greeted("Alice", "general")
+        cmd.mark_as_greeted("Alice", "test")
+        cmd.mark_as_greeted("Bob", "general")
+        assert cmd.get_greeted_users_count() == 2
+        cmd._greeted_cache_expires = 0.0
+        assert cmd.get_greeted_users_count() == 2
+
+    @pytest.mark.asyncio
+    async def test_mesh_info_contact_counts_cached(self, greeter_bot):
+        greeter_bot.repeater_manager.get_contact_statistics = AsyncMock(return_value=None)
+        greeter_bot.repeater_manager._is_repeater_device = Mock(side_effect=lambda c: c["type"] == 2)
+        greeter_bot.meshcore.contacts = {"a": {"type": 2}, "b": {"type": 1}, "c": {"type": 1}}
+        cmd = GreeterCommand(greeter_bot)
+        info = await cmd._get_mesh_info()
+        assert (info["total_contacts"], info["repeaters"], info["companions"]) == (3, 1, 2)
+        greeter_bot.meshcore.contacts["d"] = {"type": 2}
+        assert (await cmd._get_mesh_info())["total_contacts"] == 3
+        assert greeter_bot.repeater_manager._is_repeater_device.call_count == 3
+        cmd._contact_counts_cache = None
+        assert (await cmd._get_mesh_info())["repeaters"] == 2
+
+    def test_message_stats_existence_cached_once_found(self, command_mock_bot, test_db):
+        command_mock_bot.config.add_section("Greeter_Command")
+        command_mock_bot.config.set("Greeter_Command", "enabled", "true")
+        command_mock_bot.config.set("Greeter_Command", "rollout_days", "0")
+        command_mock_bot.db_manager = test_db
+        cmd = GreeterCommand(command_mock_bot)
+        assert cmd._message_stats_exists is False
+        result = cmd.backfill_greeted_users()
+        assert result["error"] == "message_stats table does not exist"
+        with test_db.connection() as conn:
+            conn.execute('CREATE TABLE message_stats (timestamp INTEGER, sender_id TEXT, channel TEXT, is_dm BOOLEAN)')
+            conn.commit()
+            cursor = conn.cursor()
+            assert cmd._has_message_stats(cursor) is True
+        cursor = Mock()
+        assert cmd._has_message_stats(cursor) is True
+        cursor.execute.assert_not_called()
+
+    def test_should_execute_matches_greeter_channels_case_insensitively(self, greeter_bot):
+        greeter_bot.config.set("Greeter_Command", "channels", "General, Mesh")
+        cmd = GreeterCommand(greeter_bot)
+        assert cmd.greeter_channels_lower == frozenset({"general", "mesh"})
+        assert cmd.should_execute(mock_message(channel="general", sender_id="Alice")) is True
+        assert cmd.should_execute(mock_message(channel="other", sender_id="Alice")) is False
+        assert cmd.should_execute(mock_message(is_dm=True, sender_id="Alice")) is False
+
+    @pytest.mark.parametrize("per_channel, expected", [
+        ("false", [("Alice", None)]),
+        ("true", [("Alice", "general"), ("Alice", "test")]),
+    ])
+    def test_mark_as_greeted_is_idempotent(self, greeter_bot, per_channel, expected):
+        greeter_bot.config.set("Greeter_Command", "per_channel_greetings", per_channel)
+        cmd = GreeterCommand(greeter_bot)
+        for channel in ("general", "general", "test", "test"):
+            assert cmd.mark_as_greeted("Alice", channel) is True
+        assert _greeted_rows(greeter_bot) == expected
+        saved = [c for c in greeter_bot.logger.info.call_args_list if "Saved" in c[0][0]]
+        assert len(saved) == len(expected)
+
+    def test_startup_auto_starts_rollout(self, greeter_bot):
+        greeter_bot.config.set("Greeter_Command", "rollout_days", "7")
+        greeter_bot.config.set("Greeter_Command", "auto_backfill", "true")
+        _add_messages(greeter_bot, [("Alice", "general", 0)])
+        cmd = GreeterCommand(greeter_bot)
+        assert _greeted_rows(greeter_bot) == [("Alice", None)]
+        assert cmd._is_rollout_active() is True
+        GreeterCommand(greeter_bot)
+        with greeter_bot.db_manager.connection() as conn:
+            assert conn.execute('SELECT COUNT(*) FROM greeter_rollout').fetchone()[0] == 1
+
+    def test_rollout_active_answer_is_cached(self, greeter_bot):
+        cmd = GreeterCommand(greeter_bot)
+        assert cmd._is_rollout_active() is False
+        rollout_id = _start_rollout_row(greeter_bot)
+        assert cmd._is_rollout_active() is False
+        cmd._rollout_cache = None
+        assert cmd._is_rollout_active() is True
+        with greeter_bot.db_manager.connection() as conn:
+            conn.execute('UPDATE greeter_rollout SET rollout_completed = 1 WHERE id = ?', (rollout_id,))
+            conn.commit()
+        assert cmd._is_rollout_active() is True
+        cmd._rollout_cache = (0.0, True)
+        assert cmd._is_rollout_active() is False
+
+    def test_start_rollout_invalidates_rollout_cache(self, greeter_bot):
+        cmd = GreeterCommand(greeter_bot)
+        assert cmd._is_rollout_active() is False
+        assert cmd.start_rollout(days=1, backfill_first=False) is True
+        assert cmd._is_rollout_active() is True
+
+    def test_rollout_lookup_uses_index(self, greeter_bot):
+        GreeterCommand(greeter_bot)
+        with greeter_bot.db_manager.connection() as conn:
+            plan = conn.execute('''
+                EXPLAIN QUERY PLAN
+                SELECT id FROM greeter_rollout
+                WHERE rollout_completed = 0
+                ORDER BY rollout_started_at DESC
+                LIMIT 1
+            ''').fetchall()
+        details = " ".join(row[3] for row in plan)
+        assert "idx_rollout_active" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_monitor_channels_fallback_rebuilt_on_reload(self, greeter_bot):
+        greeter_bot.config.set("Greeter_Command", "channels", "")
+        cmd = GreeterCommand(greeter_bot)
+        assert cmd.should_execute(mock_message(channel="General", sender_id="Alice")) is True
+        assert cmd.should_execute(mock_message(channel="Mesh", sender_id="Alice")) is False
+        greeter_bot.command_manager.monitor_channels = ["mesh"]
+        assert cmd.should_execute(mock_message(channel="Mesh", sender_id="Alice")) is False
+        cmd.on_config_reloaded()
+        assert cmd.should_execute(mock_message(channel="Mesh", sender_id="Alice")) is True
+        assert cmd.should_execute(mock_message(channel="General", sender_id="Alice")) is False
+
+    def test_should_execute_skips_rollout_check_for_greeted_users(self, greeter_bot):
+        cmd = GreeterCommand(greeter_bot)
+        cmd.mark_as_greeted("Alice", "general")
+        cmd._is_rollout_active = Mock(return_value=True)
+        assert cmd.should_execute(mock_message(channel="general", sender_id="Alice")) is False
+        cmd._is_rollout_active.assert_not_called()
+        assert cmd.should_execute(mock_message(channel="general", sender_id="Bob")) is False
+        cmd._is_rollout_active.assert_called_once()
+        assert cmd.has_been_greeted("Bob", "general") is True
+
+    def test_expired_rollout_marked_completed(self, greeter_bot):
+        cmd = GreeterCommand(greeter_bot)
+        with greeter_bot.db_manager.connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO greeter_rollout (rollout_started_at, rollout_days) VALUES (datetime('now', '-3 days'), 2)"
+            )
+            conn.commit()
+            rollout_id = cursor.lastrowid
+        assert cmd._is_rollout_active() is False
+        with greeter_bot.db_manager.connection() as conn:
+            completed = conn.execute(
+                'SELECT rollout_completed FROM greeter_rollout WHERE id = ?', (rollout_id,)
+            ).fetchone()[0]
+        assert completed == 1
+
+    @pytest.mark.asyncio
+    async def test_send_greeting_skips_debug_count_when_debug_disabled(self, greeter_bot):
+        greeter_bot.config.set("Greeter_Command", "include_mesh_info", "false")
+        cmd = GreeterCommand(greeter_bot)
+        cmd.logger = logging.getLogger("test_greeter")
+        cmd.logger.setLevel(logging.INFO)
+        cmd.get_greeted_users_count = Mock(return_value=0)
+        cmd.send_response_chunked = AsyncMock(return_value=True)
+        assert await cmd._send_greeting(mock_message(channel="general", sender_id="Alice")) is True
+        cmd.get_greeted_users_count.assert_not_called()
+        cmd.send_response_chunked.assert_awaited_once()
+
+    def test_get_greeting_for_channel(self, greeter_bot):
+        greeter_bot.config.set("Greeter_Command", "channel_greetings", "General:Hi {sender}")
+        cmd = GreeterCommand(greeter_bot)
+        assert cmd._get_greeting_for_channel("GENERAL") == "Hi {sender}"
+        assert cmd._get_greeting_for_channel("test") == cmd.greeting_message
+        assert cmd._get_greeting_for_channel("") == cmd.greeting_message
+
+    @pytest.mark.asyncio
+    async def test_mesh_info_only_fetched_when_included(self, greeter_bot):
+        greeter_bot.config.set("Greeter_Command", "greeting_message", "Hi {sender}")
+        greeter_bot.config.set("Greeter_Command", "mesh_info_format", " ({total_contacts} contacts)")
+        cmd = GreeterCommand(greeter_bot)
+        cmd._get_mesh_info = AsyncMock(return_value={"total_contacts": 5})
+        assert await cmd._format_greeting_parts("Alice") == ["Hi Alice (5 contacts)"]
+        cmd.include_mesh_info = False
+        assert await cmd._format_greeting_parts("Alice") == ["Hi Alice"]
+        cmd._get_mesh_info.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_greets_only_once(self, greeter_bot):
+        greeter_bot.config.set("Greeter_Command", "include_mesh_info", "false")
+        cmd = GreeterCommand(greeter_bot)
+        cmd.send_response_chunked = AsyncMock(return_value=True)
+        msg = mock_message(channel="general", sender_id="Alice")
+        assert cmd.should_execute(msg) is True
+        assert await cmd.execute(msg) is True
+        assert await cmd.execute(msg) is False
+        cmd.send_response_chunked.assert_awaited_once()
+        assert cmd.send_response_chunked.call_args[0][1] == ["Welcome to the mesh, Alice!"]
+        assert cmd.should_execute(msg) is False
+
+    @pytest.mark.parametrize("s1, s2, expected", [
+        ("kitten", "sitting", 3),
+        ("sitting", "kitten", 3),
+        ("", "abc", 3),
+        ("alice", "alice", 0),
+    ])
+    def test_levenshtein_distance(self, greeter_bot, s1, s2, expected):
+        cmd = GreeterCommand(greeter_bot)
+        assert cmd._levenshtein_distance(s1, s2) == expected
+        assert cmd._levenshtein_distance(s1, s2, expected) == expected
+        if expected:
+            assert cmd._levenshtein_distance(s1, s2, expected - 1) == expected
+
+    @pytest.mark.parametrize("started, expected_rollouts", [
+        ("-7 days", 1),
+        ("-30 days", 2),
+    ])
+    def test_startup_respects_recently_completed_rollout(self, greeter_bot, started, expected_rollouts):
+        GreeterCommand(greeter_bot)
+        with greeter_bot.db_manager.connection() as conn:
+            conn.execute(
+                "INSERT INTO greeter_rollout (rollout_started_at, rollout_days, rollout_completed)"
+                " VALUES (datetime('now', ?), 7, 1)", (started,)
+            )
+            conn.commit()
+        greeter_bot.config.set("Greeter_Command", "rollout_days", "7")
+        GreeterCommand(greeter_bot)
+        with greeter_bot.db_manager.connection() as conn:
+            assert conn.execute('SELECT COUNT(*) FROM greeter_rollout').fetchone()[0] == expected_rollouts
+
+    def test_human_greeting_cancels_pending_greetings(self, greeter_bot):
+        greeter_bot.config.set("Greeter_Command", "dead_air_delay_seconds", "30")
+        greeter_bot.config.set("Greeter_Command", "defer_to_human_greeting", "true")
+        greeter_bot.config.set("Greeter_Command", "levenshtein_distance", "1")
+        cmd = GreeterCommand(greeter_bot)
+        tasks = {key: Mock(done=Mock(return_value=False)) for key in [
+            ("Alice", "general"), ("Bob", "general"), ("Carol", "other"),
+        ]}
+        cmd.pending_greetings = dict(tasks)
+        cmd.check_message_for_human_greeting(
+            mock_message(content="Welcome @alice! and hi bob", channel="general", sender_id="Dave")
+        )
+        assert list(cmd.pending_greetings) == [("Carol", "other")]
+        tasks[("Alice", "general")].cancel.assert_called_once()
+        tasks[("Bob", "general")].cancel.assert_called_once()
+        assert _greeted_rows(greeter_bot) == [("Alice", None), ("Bob", None)]
+
+    @pytest.mark.parametrize("per_channel", [False, True])
+    def test_find_similar_greeted_user(self, greeter_bot, per_channel):
+        greeter_bot.config.set("Greeter_Command", "levenshtein_distance", "2")
+        greeter_bot.config.set("Greeter_Command", "per_channel_greetings", str(per_channel).lower())
+        cmd = GreeterCommand(greeter_bot)
+        for sender_id in ("Alice", "Al", "Alexandra"):
+            cmd.mark_as_greeted(sender_id, "general")
+        assert cmd._find_similar_greeted_user("alicia", "general") == "Alice"
+        assert cmd._find_similar_greeted_user("Alexandria", "general") == "Alexandra"
+        assert cmd._find_similar_greeted_user("Bob", "general") is None
+        assert cmd.has_been_greeted("Alic", "general") is True
+
+    def test_duplicate_cleanup_runs_once_per_schema_version(self, greeter_bot, monkeypatch):
+        cmd = GreeterCommand(greeter_bot)
+        assert greeter_bot.db_manager.get_metadata(GreeterCommand.SCHEMA_VERSION_KEY) == str(GreeterCommand.SCHEMA_VERSION)
+        with greeter_bot.db_manager.connection() as conn:
+            conn.executemany('INSERT INTO greeted_users (sender_id, channel) VALUES (?, NULL)', [("Alice",), ("Alice",)])
+            conn.commit()
+        GreeterCommand(greeter_bot)
+        assert _greeted_rows(greeter_bot) == [("Alice", None), ("Alice", None)]
+        monkeypatch.setattr(GreeterCommand, "SCHEMA_VERSION", GreeterCommand.SCHEMA_VERSION + 1)
+        GreeterCommand(greeter_bot)
+        assert _greeted_rows(greeter_bot) == [("Alice", None)]
+        assert cmd._get_schema_version() == GreeterCommand.SCHEMA_VERSION
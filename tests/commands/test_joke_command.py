@@ -0,0 +1,25 @@
+"""Tests for modules.commands.joke_command."""
+
+import pytest
+
+from modules.commands.joke_command import JokeCommand
+from tests.conftest import command_mock_bot, mock_message
+
+
+class TestJokeCommand:
+    """Tests for JokeCommand."""
+
+    def test_matches_keyword(self, command_mock_bot):
+        cmd = JokeCommand(command_mock_bot)
+        assert cmd.matches_keyword(mock_message(content="joke")) is True
+        assert cmd.matches_keyword(mock_message(content="!Jokes pun")) is True
+        assert cmd.matches_keyword(mock_message(content="jokester")) is False
+
+    @pytest.mark.asyncio
+    async def test_session_reused_and_closed(self, command_mock_bot):
+        cmd = JokeCommand(command_mock_bot)
+        session = await cmd._get_session()
+        assert await cmd._get_session() is session
+        await cmd.close()
+        assert session.closed
+        assert cmd._session is None
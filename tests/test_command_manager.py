@@ -449,3 +449,40 @@ class TestSendChannelMessagesChunked:
 
         assert result is False
         manager.send_channel_message.assert_called_once()
+
+
+class TestKeywordIndex:
+    """Tests for the first-word keyword index used by execute_commands()."""
+
+    def _commands(self, cm_bot):
+        from modules.commands.catfact_command import CatfactCommand
+        from modules.commands.channels_command import ChannelsCommand
+        return {"catfact": CatfactCommand(cm_bot), "channels": ChannelsCommand(cm_bot)}
+
+    def test_default_matching_commands_indexed(self, cm_bot):
+        commands = self._commands(cm_bot)
+        manager = make_manager(cm_bot, commands)
+        candidates, indexed = manager._get_keyword_candidates("Catfact please")
+        assert "catfact" in indexed
+        # ChannelsCommand overrides matches_keyword, so it is never filtered out
+        assert "channels" not in indexed
+        assert candidates == frozenset({"catfact"})
+        assert manager._get_keyword_candidates("@[TestBot] catfact")[0] == frozenset({"catfact"})
+        assert manager._get_keyword_candidates("ping")[0] == frozenset()
+
+    def test_invalidate_picks_up_new_keywords(self, cm_bot):
+        commands = self._commands(cm_bot)
+        manager = make_manager(cm_bot, commands)
+        assert manager._get_keyword_candidates("kitty")[0] == frozenset()
+        commands["catfact"].keywords = commands["catfact"].keywords + ["kitty"]
+        manager.invalidate_keyword_index()
+        assert manager._get_keyword_candidates("kitty")[0] == frozenset({"catfact"})
+
+    @pytest.mark.asyncio
+    async def test_execute_commands_skips_non_candidates(self, cm_bot):
+        commands = self._commands(cm_bot)
+        manager = make_manager(cm_bot, commands)
+        from modules.commands.base_command import BaseCommand
+        with patch.object(BaseCommand, "matches_keyword", autospec=True, return_value=False) as matches:
+            await manager.execute_commands(mock_message(content="ping", is_dm=True))
+        assert all(call.args[0] is not commands["catfact"] for call in matches.call_args_list)
@@ -0,0 +1,122 @@
+"""Tests for FeedManager conditional RSS requests (ETag / Last-Modified)."""
+
+import pytest
+from configparser import ConfigParser
+from unittest.mock import AsyncMock, Mock
+
+from modules.feed_manager import FeedManager
+
+EMPTY_RSS = '<?xml version="1.0"?><rss version="2.0"><channel><title>t</title></channel></rss>'
+ITEM_RSS = (
+    '<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>'
+    '<item><guid>new-1</guid><title>New</title></item></channel></rss>'
+)
+
+
+class _FakeResponse:
+    def __init__(self, status, headers=None, body=""):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def text(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.request_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.request_headers.append(headers)
+        return self.responses.pop(0)
+
+
+class _EtagServer:
+    """Serves one feed version and answers 304 to a matching If-None-Match."""
+
+    def __init__(self, etag, body):
+        self.etag = etag
+        self.body = body
+        self.request_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.request_headers.append(headers)
+        if headers and headers.get('If-None-Match') == self.etag:
+            return _FakeResponse(304)
+        return _FakeResponse(200, {'ETag': self.etag}, self.body)
+
+
+@pytest.fixture
+def fm(mock_logger):
+    bot = Mock()
+    bot.logger = mock_logger
+    bot.config = ConfigParser()
+    bot.db_manager = Mock()
+    bot.db_manager.db_path = "/dev/null"
+    return FeedManager(bot)
+
+
+class TestConditionalRssRequests:
+    """Tests for ETag / Last-Modified handling in process_rss_feed()."""
+
+    @pytest.mark.asyncio
+    async def test_validators_sent_and_304_returns_no_items(self, fm):
+        feed = {'id': 1, 'feed_url': 'https://example.com/rss'}
+        fm.session = _FakeSession([
+            _FakeResponse(200, {'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}, EMPTY_RSS),
+            _FakeResponse(304),
+        ])
+        assert await fm.process_rss_feed(feed) == []
+        assert await fm.process_rss_feed(feed) == []
+        assert fm.session.request_headers[0] is None
+        assert fm.session.request_headers[1] == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT',
+        }
+
+    @pytest.mark.asyncio
+    async def test_validators_dropped_when_server_stops_sending_them(self, fm):
+        feed = {'id': 1, 'feed_url': 'https://example.com/rss'}
+        fm.session = _FakeSession([
+            _FakeResponse(200, {'ETag': '"abc"'}, EMPTY_RSS),
+            _FakeResponse(200, {}, EMPTY_RSS),
+            _FakeResponse(200, {}, EMPTY_RSS),
+        ])
+        for _ in range(3):
+            await fm.process_rss_feed(feed)
+        assert fm.session.request_headers[2] is None
+
+    @pytest.mark.asyncio
+    async def test_validators_kept_per_subscription(self, fm):
+        url = 'https://example.com/rss'
+        fm.session = _EtagServer('"v2"', ITEM_RSS)
+        for feed_id in (1, 2):
+            feed = {'id': feed_id, 'feed_url': url, 'channel_name': f'#c{feed_id}'}
+            items = await fm.process_rss_feed(feed)
+            assert [item['id'] for item in items] == ['new-1']
+        assert fm.session.request_headers == [None, None]
+        assert await fm.process_rss_feed({'id': 1, 'feed_url': url}) == []
+
+    @pytest.mark.asyncio
+    async def test_validators_dropped_when_items_not_queued(self, fm):
+        feed = {'id': 1, 'feed_type': 'rss', 'feed_url': 'https://example.com/rss', 'channel_name': '#a'}
+        fm.session = _EtagServer('"v2"', ITEM_RSS)
+        fm._ensure_session = AsyncMock()
+        fm._wait_for_rate_limit = AsyncMock()
+        fm._update_feed_last_check = Mock()
+        fm._update_feed_last_item_id = Mock()
+        fm._send_feed_item = AsyncMock(return_value=False)
+        await fm.poll_feed(feed)
+        assert 1 not in fm._rss_validators
+        fm._send_feed_item.return_value = True
+        await fm.poll_feed(feed)
+        assert fm.session.request_headers == [None, None]
+        assert fm._rss_validators[1] == {'If-None-Match': '"v2"'}